@@ -1,17 +1,23 @@
-from .company_research_agent import run_company_research_agent
-from .industry_analysis_agent import run_industry_analysis_agent
-from .market_data_agent import run_market_data_agent
-from .competitive_landscape_agent import run_competitive_landscape_agent
-from .market_gap_agent import run_market_gap_analysis_agent
-from .opportunity_agent import run_opportunity_agent
-from .report_synthesis_agent import run_report_synthesis_agent
+import importlib
 
-__all__ = [
-    'run_company_research_agent',
-    'run_industry_analysis_agent',
-    'run_market_data_agent',
-    'run_competitive_landscape_agent',
-    'run_market_gap_analysis_agent',
-    'run_opportunity_agent',
-    'run_report_synthesis_agent'
-]
\ No newline at end of file
+# Agents are imported on first attribute access (PEP 562) so importing one
+# agent module does not load every agent and its Haystack/MCP dependencies
+_EXPORTS = {
+    'run_company_research_agent': '.company_research_agent',
+    'run_industry_analysis_agent': '.industry_analysis_agent',
+    'run_market_data_agent': '.market_data_agent',
+    'run_competitive_landscape_agent': '.competitive_landscape_agent',
+    'run_market_gap_analysis_agent': '.market_gap_agent',
+    'run_opportunity_agent': '.opportunity_agent',
+    'run_report_synthesis_agent': '.report_synthesis_agent'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,5 +1,6 @@
+import functools
 import os
-import json
+import orjson
 from typing import Dict, Any
 from dotenv import load_dotenv
 from haystack.components.generators.chat import OpenAIChatGenerator
@@ -12,6 +13,7 @@ from haystack.utils import Secret
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+@functools.lru_cache(maxsize=1)
 def create_company_research_agent():
     """Factory function to create a configured company research agent"""
     server_info = SSEServerInfo(
@@ -85,13 +87,13 @@ def run_company_research_agent(company_name: str) -> Dict[str, Any]:
         
         # Try to parse as JSON
         try:
-            company_data = json.loads(final_message)
+            company_data = orjson.loads(final_message)
             return {
                 "success": True,
                 "data": company_data,
                 "raw_response": final_message
             }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return {
                 "success": False,
                 "error": "Invalid JSON response from agent",
@@ -99,6 +101,8 @@ def run_company_research_agent(company_name: str) -> Dict[str, Any]:
             }
             
     except Exception as e:
+        # Drop the cached agent so a dead MCP connection is rebuilt next run
+        create_company_research_agent.cache_clear()
         return {
             "success": False,
             "error": str(e),
@@ -1,5 +1,6 @@
+import functools
 import os
-import json
+import orjson
 from typing import Dict, Any
 from dotenv import load_dotenv
 from haystack.components.generators.chat import OpenAIChatGenerator
@@ -12,6 +13,7 @@ from haystack.utils import Secret
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+@functools.lru_cache(maxsize=1)
 def create_competitive_landscape_agent():
     """Factory function to create a configured competitive landscape agent"""
     server_info = SSEServerInfo(
@@ -103,13 +105,13 @@ Identify key competitors, their products, market positions, and competitive stra
         
         # Try to parse as JSON
         try:
-            competitors_data = json.loads(final_message)
+            competitors_data = orjson.loads(final_message)
             return {
                 "success": True,
                 "data": competitors_data,
                 "raw_response": final_message
             }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return {
                 "success": False,
                 "error": "Invalid JSON response from agent",
@@ -117,6 +119,8 @@ Identify key competitors, their products, market positions, and competitive stra
             }
             
     except Exception as e:
+        # Drop the cached agent so a dead MCP connection is rebuilt next run
+        create_competitive_landscape_agent.cache_clear()
         return {
             "success": False,
             "error": str(e),
@@ -1,5 +1,7 @@
+import functools
 import os
 import json
+import orjson
 from typing import Dict, Any, List
 from dotenv import load_dotenv
 from haystack.components.generators.chat import OpenAIChatGenerator
@@ -12,6 +14,7 @@ from haystack.utils import Secret
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+@functools.lru_cache(maxsize=1)
 def create_industry_analysis_agent():
     """
     Factory function to create an agent that analyzes a company's profile 
@@ -75,13 +78,13 @@ def run_industry_analysis_agent(company_profile: Dict[str, Any]) -> Dict[str, An
         
         # Try to parse as JSON
         try:
-            output_data = json.loads(final_message)
+            output_data = orjson.loads(final_message)
             return {
                 "success": True,
                 "data": output_data,
                 "raw_response": final_message
             }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return {
                 "success": False,
                 "error": "Invalid JSON response from agent",
@@ -89,6 +92,8 @@ def run_industry_analysis_agent(company_profile: Dict[str, Any]) -> Dict[str, An
             }
             
     except Exception as e:
+        # Drop the cached agent so a dead MCP connection is rebuilt next run
+        create_industry_analysis_agent.cache_clear()
         return {
             "success": False,
             "error": str(e),
@@ -1,5 +1,6 @@
+import functools
 import os
-import json
+import orjson
 from typing import Dict, Any
 from dotenv import load_dotenv
 from haystack.components.generators.chat import OpenAIChatGenerator
@@ -13,6 +14,7 @@ import traceback
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+@functools.lru_cache(maxsize=1)
 def create_market_data_agent() -> Agent:
     """Create and return a configured Haystack Agent for market data"""
     server_info = SSEServerInfo(base_url="http://localhost:8000")
@@ -91,13 +93,13 @@ def run_market_data_agent(domain: str) -> Dict[str, Any]:
 
         try:
             # Try to parse as JSON
-            market_data = json.loads(final_message)
+            market_data = orjson.loads(final_message)
             return {
                 "success": True,
                 "data": market_data,
                 "raw_response": final_message
             }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return {
                 "success": False,
                 "error": "Agent returned invalid JSON.",
@@ -105,6 +107,8 @@ def run_market_data_agent(domain: str) -> Dict[str, Any]:
             }
 
     except Exception as e:
+        # Drop the cached agent so a dead MCP connection is rebuilt next run
+        create_market_data_agent.cache_clear()
         return {
             "success": False,
             "error": f"{type(e).__name__}: {str(e)}",
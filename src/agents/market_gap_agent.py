@@ -1,5 +1,6 @@
+import functools
 import os
-import json
+import orjson
 from typing import Dict, Any, List
 from dotenv import load_dotenv
 from haystack.components.generators.chat import OpenAIChatGenerator
@@ -13,6 +14,7 @@ from haystack.components.builders import PromptBuilder
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+@functools.lru_cache(maxsize=1)
 def create_market_gap_analysis_agent():
     """Factory function to create a configured market gap research agent"""
     server_info = SSEServerInfo(
@@ -125,13 +127,13 @@ def run_market_gap_analysis_agent(incoming_company_stats: Dict[str,Any]) -> Dict
         
         # Try to parse as JSON
         try:
-            company_data = json.loads(final_message)
+            company_data = orjson.loads(final_message)
             return {
                 "success": True,
                 "data": company_data,
                 "raw_response": final_message
             }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return {
                 "success": False,
                 "error": "Invalid JSON response from agent",
@@ -139,6 +141,8 @@ def run_market_gap_analysis_agent(incoming_company_stats: Dict[str,Any]) -> Dict
             }
             
     except Exception as e:
+        # Drop the cached agent so a dead MCP connection is rebuilt next run
+        create_market_gap_analysis_agent.cache_clear()
         return {
             "success": False,
             "error": str(e),
@@ -1,5 +1,7 @@
+import functools
 import os
 import json
+import orjson
 import traceback
 from typing import Dict, Any
 from dotenv import load_dotenv
@@ -14,6 +16,7 @@ from haystack_integrations.tools.mcp import MCPTool, SSEServerInfo
 load_dotenv()
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+@functools.lru_cache(maxsize=1)
 def create_opportunity_agent():
     """
     Factory function to create the opportunity_agent for strategic growth opportunities.
@@ -96,13 +99,13 @@ def run_opportunity_agent(input_data: Dict[str, Any]) -> Dict[str, Any]:
 
         # Parse the JSON safely
         try:
-            parsed_data = json.loads(final_message)
+            parsed_data = orjson.loads(final_message)
             return {
                 "success": True,
                 "data": parsed_data,
                 "raw_response": final_message
             }
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             return {
                 "success": False,
                 "error": "Response is not valid JSON.",
@@ -110,6 +113,8 @@ def run_opportunity_agent(input_data: Dict[str, Any]) -> Dict[str, Any]:
             }
 
     except Exception as e:
+        # Drop the cached agent so a dead MCP connection is rebuilt next run
+        create_opportunity_agent.cache_clear()
         return {
             "success": False,
             "error": f"{type(e).__name__}: {str(e)}",
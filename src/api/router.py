@@ -1,6 +1,8 @@
 import sys
 import os
+import base64
 from fastapi import FastAPI, HTTPException, APIRouter, Query
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from typing import Dict, Any
 
@@ -12,8 +14,14 @@ sys.path.insert(0, project_root)
 from src.api.routes import api_router
 from src.utils.mcp_manager import MCPServerManager
 from src.pipeline import pipeline
+from src.utils.models import ReportSynthesisResponse
 
-app = FastAPI(title="Ambitus AI Models API", version="0.0.1")
+# orjson renders the JSON bodies of every route (the PDF route sets its own class)
+app = FastAPI(
+    title="Ambitus AI Models API",
+    version="0.0.1",
+    default_response_class=ORJSONResponse
+)
 
 # Initialize utilities
 mcp_manager = MCPServerManager()
@@ -53,12 +61,24 @@ class PipelineRequest(BaseModel):
     company: str
     domain: str | None = None
 
+def encode_pdf_content(response: ReportSynthesisResponse) -> ReportSynthesisResponse:
+    """Base64-encode the raw PDF bytes so the report can be sent as JSON"""
+    if not response.success or not response.data or "pdf_content" not in response.data:
+        return response
+    pdf_content = response.data["pdf_content"]
+    if isinstance(pdf_content, str):
+        pdf_content = pdf_content.encode('utf-8')
+    data = response.data.copy()
+    data["pdf_content"] = base64.b64encode(pdf_content).decode('utf-8')
+    return response.model_copy(update={"data": data})
+
 @app.post("/run-pipeline")
-def run_pipeline(payload: PipelineRequest):
-    return pipeline.run_linear_pipeline(
+async def run_pipeline(payload: PipelineRequest):
+    result = await pipeline.run_linear_pipeline(
         company_name=payload.company,
         selected_domain=payload.domain
     )
+    return encode_pdf_content(result)
 
 if __name__ == "__main__":
     import uvicorn
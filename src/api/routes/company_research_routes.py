@@ -1,14 +1,14 @@
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 from src.agents.company_research_agent import run_company_research_agent
-from src.utils.validation import CompanyValidator
+from src.utils.validation import COMPANY_VALIDATOR
 from src.utils.mcp_manager import MCPServerManager
 from src.utils.models import CompanyResearchRequest, CompanyResponse
 
 router = APIRouter()
 
 # Initialize utilities
-company_validator = CompanyValidator()
+company_validator = COMPANY_VALIDATOR
 mcp_manager = MCPServerManager()
 
 @router.post("/", response_model=CompanyResponse)
@@ -38,16 +38,16 @@ async def research_company(request: CompanyResearchRequest) -> CompanyResponse:
     # Validate the output
     validation_result = company_validator.validate(agent_result["data"])
     
-    if not validation_result["valid"]:
+    if not validation_result.valid:
         return CompanyResponse(
             success=False,
-            error=validation_result['error'],
+            error=validation_result.error,
             raw_response=agent_result.get("raw_response")
         )
     
     return CompanyResponse(
         success=True,
-        data=validation_result["data"],
+        data=validation_result.data,
         raw_response=agent_result.get("raw_response")
     )
 
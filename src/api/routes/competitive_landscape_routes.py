@@ -1,14 +1,14 @@
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 from src.agents.competitive_landscape_agent import run_competitive_landscape_agent
-from src.utils.validation import CompetitiveLandscapeValidator
+from src.utils.validation import COMPETITIVE_LANDSCAPE_VALIDATOR
 from src.utils.mcp_manager import MCPServerManager
 from src.utils.models import IndustryOpportunity, CompetitiveLandscapeResponse
 
 router = APIRouter()
 
 # Initialize utilities
-competitive_landscape_validator = CompetitiveLandscapeValidator()
+competitive_landscape_validator = COMPETITIVE_LANDSCAPE_VALIDATOR
 mcp_manager = MCPServerManager()
 
 @router.post("/", response_model=CompetitiveLandscapeResponse)
@@ -25,14 +25,14 @@ async def analyze_competitive_landscape(request: IndustryOpportunity) -> Competi
             detail=f"MCP server not available: {mcp_status['message']}"
         ) 
     
-    # Validate input
+    # FastAPI already validated the body against the request model
     input_data = request.model_dump()
-    input_validation = competitive_landscape_validator.validate_input(input_data)
+    input_validation = competitive_landscape_validator.validate_input(input_data, trusted=True)
     
-    if not input_validation["valid"]:
+    if not input_validation.valid:
         return CompetitiveLandscapeResponse(
             success=False,
-            error=f"Input validation failed: {input_validation['error']}"
+            error=f"Input validation failed: {input_validation.error}"
         )
         
     # Run the agent
@@ -48,16 +48,16 @@ async def analyze_competitive_landscape(request: IndustryOpportunity) -> Competi
     # Validate the output
     validation_result = competitive_landscape_validator.validate_output(agent_result["data"])
     
-    if not validation_result["valid"]:
+    if not validation_result.valid:
         return CompetitiveLandscapeResponse(
             success=False,
-            error=validation_result['error'],
+            error=validation_result.error,
             raw_response=agent_result.get("raw_response")
         )
     
     return CompetitiveLandscapeResponse(
         success=True,
-        data=validation_result["data"],
+        data=validation_result.data,
         raw_response=agent_result.get("raw_response")
     )
 
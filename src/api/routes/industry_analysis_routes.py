@@ -1,13 +1,13 @@
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 from src.agents.industry_analysis_agent import run_industry_analysis_agent
-from src.utils.validation import IndustryAnalysisValidator
+from src.utils.validation import INDUSTRY_ANALYSIS_VALIDATOR
 from src.utils.models import Company, IndustryAnalysisResponse
 
 router = APIRouter()
 
-# Initialize validator
-validator = IndustryAnalysisValidator()
+# Shared validator instance
+validator = INDUSTRY_ANALYSIS_VALIDATOR
 
 @router.post("/", response_model=IndustryAnalysisResponse)
 async def analyze_industry_opportunities(request: Company) -> IndustryAnalysisResponse:
@@ -20,19 +20,17 @@ async def analyze_industry_opportunities(request: Company) -> IndustryAnalysisRe
     Returns:
         Response containing success status and industry opportunities or error
     """
-    # Convert request to dict for validation
-    company_data = request.model_dump()
-    
-    # Validate input
-    input_validation = validator.validate_input(company_data)
-    if not input_validation["valid"]:
+    # Hand the already-validated model over as-is; the validator dumps it
+    # without running validation again
+    input_validation = validator.validate_input(request)
+    if not input_validation.valid:
         return IndustryAnalysisResponse(
             success=False,
-            error=f"Invalid input data: {input_validation['error']}"
+            error=f"Invalid input data: {input_validation.error}"
         )
     
     # Run the industry analysis agent
-    result = run_industry_analysis_agent(input_validation["data"])
+    result = run_industry_analysis_agent(input_validation.data)
     
     if not result["success"]:
         return IndustryAnalysisResponse(
@@ -43,16 +41,16 @@ async def analyze_industry_opportunities(request: Company) -> IndustryAnalysisRe
     
     # Validate output
     output_validation = validator.validate_output(result["data"])
-    if not output_validation["valid"]:
+    if not output_validation.valid:
         return IndustryAnalysisResponse(
             success=False,
-            error=output_validation['error'],
+            error=output_validation.error,
             raw_response=result.get("raw_response")
         )
     
     return IndustryAnalysisResponse(
         success=True,
-        data=output_validation["data"],
+        data=output_validation.data,
         raw_response=result.get("raw_response")
     )
 
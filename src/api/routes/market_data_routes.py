@@ -1,12 +1,12 @@
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 from src.agents.market_data_agent import run_market_data_agent
-from src.utils.validation import MarketDataValidator
+from src.utils.validation import MARKET_DATA_VALIDATOR
 from src.utils.models import MarketDataRequest, MarketDataResponse
 
 
 router = APIRouter()
-validator = MarketDataValidator()
+validator = MARKET_DATA_VALIDATOR
 
 @router.post("/", response_model=MarketDataResponse, tags=["market_data"])
 async def fetch_market_data(request: MarketDataRequest) -> MarketDataResponse:
@@ -16,11 +16,11 @@ async def fetch_market_data(request: MarketDataRequest) -> MarketDataResponse:
     try:
         # Validate input
         input_validation = validator.validate_input(request.model_dump())
-        if not input_validation["valid"]:
-            return MarketDataResponse(success=False, error=input_validation["error"])
+        if not input_validation.valid:
+            return MarketDataResponse(success=False, error=input_validation.error)
 
         # Run agent
-        agent_result = run_market_data_agent(input_validation["data"]["domain"])
+        agent_result = run_market_data_agent(input_validation.data["domain"])
 
         if not agent_result["success"]:
             return MarketDataResponse(
@@ -31,16 +31,16 @@ async def fetch_market_data(request: MarketDataRequest) -> MarketDataResponse:
 
         # Validate output
         output_validation = validator.validate_output(agent_result["data"])
-        if not output_validation["valid"]:
+        if not output_validation.valid:
             return MarketDataResponse(
                 success=False,
-                error=output_validation["error"],
+                error=output_validation.error,
                 raw_response=agent_result.get("raw_response")
             )
 
         return MarketDataResponse(
             success=True,
-            data=output_validation["data"],
+            data=output_validation.data,
             raw_response=agent_result.get("raw_response")
         )
 
@@ -1,13 +1,13 @@
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 from src.agents.market_gap_agent import run_market_gap_analysis_agent
-from src.utils.validation import MarketGapAnalysisValidator
+from src.utils.validation import MARKET_GAP_ANALYSIS_VALIDATOR
 from src.utils.models import MarketGapAnalysisRequest, MarketGapAnalysisResponse
 
 router = APIRouter()
 
-# Initialize validator
-validator = MarketGapAnalysisValidator()
+# Shared validator instance
+validator = MARKET_GAP_ANALYSIS_VALIDATOR
 
 @router.post("/", response_model=MarketGapAnalysisResponse)
 async def analyze_market_gaps(request: MarketGapAnalysisRequest) -> MarketGapAnalysisResponse:
@@ -23,16 +23,16 @@ async def analyze_market_gaps(request: MarketGapAnalysisRequest) -> MarketGapAna
     # Convert request to dict for validation
     incoming_data_dict = request.model_dump()
     
-    # Validate input
-    input_validation = validator.validate_input(incoming_data_dict)
-    if not input_validation["valid"]:
+    # FastAPI already validated the body against the request model
+    input_validation = validator.validate_input(incoming_data_dict, trusted=True)
+    if not input_validation.valid:
         return MarketGapAnalysisResponse(
             success=False,
-            error=f"Invalid input data: {input_validation['error']}"
+            error=f"Invalid input data: {input_validation.error}"
         )
     
     # Run the market gap analyst agent
-    result = run_market_gap_analysis_agent(input_validation["data"])
+    result = run_market_gap_analysis_agent(input_validation.data)
     
     if not result["success"]:
         return MarketGapAnalysisResponse(
@@ -43,16 +43,16 @@ async def analyze_market_gaps(request: MarketGapAnalysisRequest) -> MarketGapAna
     
     # Validate output
     output_validation = validator.validate_output(result["data"])
-    if not output_validation["valid"]:
+    if not output_validation.valid:
         return MarketGapAnalysisResponse(
             success=False,
-            error=output_validation['error'],
+            error=output_validation.error,
             raw_response=result.get("raw_response")
         )
     
     return MarketGapAnalysisResponse(
         success=True,
-        data=output_validation["data"],
+        data=output_validation.data,
         raw_response=result.get("raw_response")
     )
 
@@ -3,11 +3,11 @@ from typing import Dict, Any, List
 import json
 
 from src.agents.opportunity_agent import run_opportunity_agent
-from src.utils.validation import OpportunityValidator
+from src.utils.validation import OPPORTUNITY_VALIDATOR
 from src.utils.models import MarketGap, OpportunityResponse
 
 router = APIRouter()
-validator = OpportunityValidator()
+validator = OPPORTUNITY_VALIDATOR
 
 # -------------------- POST ENDPOINT --------------------
 
@@ -24,17 +24,17 @@ async def opportunity_agent_endpoint(request: List[MarketGap]) -> OpportunityRes
     """
     input_list = [item.model_dump() for item in request]
 
-    # Validate input
-    input_validation = validator.validate_input(input_list)
-    if not input_validation["valid"]:
+    # FastAPI already validated the body against the request model
+    input_validation = validator.validate_input(input_list, trusted=True)
+    if not input_validation.valid:
         return OpportunityResponse(
             success=False,
-            error=input_validation["error"]
+            error=input_validation.error
         )
 
     try:
         # Run the agent
-        result = run_opportunity_agent(input_validation["data"])
+        result = run_opportunity_agent(input_validation.data)
 
         # Ensure result is a dict with success flag and data list
         if not isinstance(result, dict) or not result.get("success") or not isinstance(result.get("data"), list):
@@ -46,16 +46,16 @@ async def opportunity_agent_endpoint(request: List[MarketGap]) -> OpportunityRes
 
         # Validate output
         output_validation = validator.validate_output(result["data"])
-        if not output_validation["valid"]:
+        if not output_validation.valid:
             return OpportunityResponse(
                 success=False,
-                error=output_validation["error"],
+                error=output_validation.error,
                 raw_response=result.get("raw_response")
             )
 
         return OpportunityResponse(
             success=True,
-            data=output_validation["data"],
+            data=output_validation.data,
             raw_response=result.get("raw_response")
         )
 
@@ -14,13 +14,13 @@ from fastapi import APIRouter, HTTPException
 from fastapi.responses import Response
 from typing import Dict, Any
 from src.agents.report_synthesis_agent import run_report_synthesis_agent
-from src.utils.validation import ReportSynthesisValidator
+from src.utils.validation import REPORT_SYNTHESIS_VALIDATOR
 from src.utils.models import ReportSynthesisRequest, ReportSynthesisResponse
 
 router = APIRouter()
 
-# Initialize validator
-validator = ReportSynthesisValidator()
+# Shared validator instance
+validator = REPORT_SYNTHESIS_VALIDATOR
 
 @router.post("/", response_class=Response)
 async def synthesize_report(request: ReportSynthesisRequest):
@@ -37,14 +37,14 @@ async def synthesize_report(request: ReportSynthesisRequest):
     
     # Validate input
     input_validation = validator.validate_input(report_data)
-    if not input_validation["valid"]:
+    if not input_validation.valid:
         raise HTTPException(
             status_code=400,
-            detail=f"Invalid input data: {input_validation['error']}"
+            detail=f"Invalid input data: {input_validation.error}"
         )
     
     # Run the report synthesis agent
-    result = run_report_synthesis_agent(input_validation["data"])
+    result = run_report_synthesis_agent(input_validation.data)
     
     if not result["success"]:
         raise HTTPException(
@@ -54,14 +54,14 @@ async def synthesize_report(request: ReportSynthesisRequest):
     
     # Validate output
     output_validation = validator.validate_output(result["data"])
-    if not output_validation["valid"]:
+    if not output_validation.valid:
         raise HTTPException(
             status_code=500,
-            detail=f"Output validation failed: {output_validation['error']}"
+            detail=f"Output validation failed: {output_validation.error}"
         )
     
     # Return PDF as binary response
-    pdf_content = output_validation["data"]["pdf_content"]
+    pdf_content = output_validation.data["pdf_content"]
     
     # Handle both bytes and string content
     if isinstance(pdf_content, str):
@@ -71,9 +71,9 @@ async def synthesize_report(request: ReportSynthesisRequest):
         content=pdf_content,
         media_type="application/pdf",
         headers={
-            "Content-Disposition": f"attachment; filename=\"{output_validation['data']['report_title'].replace(' ', '_')}.pdf\"",
+            "Content-Disposition": f"attachment; filename=\"{output_validation.data['report_title'].replace(' ', '_')}.pdf\"",
             "X-Placeholder": "true",  # Indicate this is a placeholder implementation
-            "X-Generated-At": output_validation['data']['generated_at']
+            "X-Generated-At": output_validation.data['generated_at']
         }
     )
 
@@ -90,14 +90,14 @@ async def synthesize_report_json(request: ReportSynthesisRequest) -> ReportSynth
     
     # Validate input
     input_validation = validator.validate_input(report_data)
-    if not input_validation["valid"]:
+    if not input_validation.valid:
         return ReportSynthesisResponse(
             success=False,
-            error=f"Invalid input data: {input_validation['error']}"
+            error=f"Invalid input data: {input_validation.error}"
         )
     
     # Run the report synthesis agent
-    result = run_report_synthesis_agent(input_validation["data"])
+    result = run_report_synthesis_agent(input_validation.data)
     
     if not result["success"]:
         return ReportSynthesisResponse(
@@ -108,20 +108,20 @@ async def synthesize_report_json(request: ReportSynthesisRequest) -> ReportSynth
     
     # Validate output
     output_validation = validator.validate_output(result["data"])
-    if not output_validation["valid"]:
+    if not output_validation.valid:
         return ReportSynthesisResponse(
             success=False,
-            error=output_validation["error"],
+            error=output_validation.error,
             raw_response=result.get("raw_response")
         )
     
     # Convert PDF content to base64 for JSON response
     import base64
-    pdf_content = output_validation["data"]["pdf_content"]
+    pdf_content = output_validation.data["pdf_content"]
     if isinstance(pdf_content, str):
         pdf_content = pdf_content.encode('utf-8')
     
-    response_data = output_validation["data"].copy()
+    response_data = output_validation.data.copy()
     response_data["pdf_content"] = base64.b64encode(pdf_content).decode('utf-8')
     
     return ReportSynthesisResponse(
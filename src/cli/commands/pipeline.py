@@ -1,5 +1,6 @@
+import asyncio
 import click
-import json
+import orjson
 import sys
 from pathlib import Path
 from typing import Optional
@@ -12,6 +13,29 @@ from src.pipeline.pipeline import run_linear_pipeline
 
 console = Console()
 
+
+def _default(obj):
+    """orjson fallback for values it cannot encode natively"""
+    if isinstance(obj, bytes):
+        return f"<{len(obj)} bytes>"
+    return str(obj)
+
+
+def _dumps(result: dict) -> bytes:
+    """Serialize a pipeline result as indented JSON bytes"""
+    return orjson.dumps(result, default=_default, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+
+def _write_pdf_alongside(result: dict, output_path: Path) -> None:
+    """Write the report PDF next to `output_path` and reference it instead of inlining the bytes"""
+    data = result.get('data') or {}
+    pdf_content = data.get('pdf_content')
+    if isinstance(pdf_content, bytes):
+        pdf_path = output_path.with_suffix('.pdf')
+        pdf_path.write_bytes(pdf_content)
+        data['pdf_content'] = None
+        data['pdf_path'] = str(pdf_path)
+
 @click.command(name="pipeline")
 @click.argument('company_name')
 @click.option('--domain', help='Specific domain to analyze (optional)')
@@ -36,7 +60,11 @@ def pipeline_command(company_name: str, domain: Optional[str], output: Optional[
         
         try:
             # Run the pipeline
-            result = run_linear_pipeline(company_name, domain)
+            result = asyncio.run(run_linear_pipeline(
+                company_name,
+                domain,
+                progress_cb=lambda step: progress.update(task, description=f"Step: {step}"),
+            )).model_dump()
             
             if result.get('success'):
                 console.print("[green]✓ Pipeline completed successfully![/green]")
@@ -47,11 +75,12 @@ def pipeline_command(company_name: str, domain: Optional[str], output: Optional[
                     output_path.parent.mkdir(parents=True, exist_ok=True)
                     
                     if output_format == 'json':
-                        with open(output_path, 'w') as f:
-                            json.dump(result, f, indent=2)
+                        _write_pdf_alongside(result, output_path)
+                        with open(output_path, 'wb') as f:
+                            f.write(_dumps(result))
                     elif output_format == 'markdown':
                         # Extract markdown content if available
-                        content = result.get('pdf_content', json.dumps(result, indent=2))
+                        content = result.get('pdf_content', _dumps(result).decode())
                         with open(output_path, 'w') as f:
                             f.write(content)
                     
@@ -59,7 +88,7 @@ def pipeline_command(company_name: str, domain: Optional[str], output: Optional[
                 else:
                     # Display results in console
                     console.print("\n[bold]Pipeline Results:[/bold]")
-                    console.print(JSON(json.dumps(result, indent=2)))
+                    console.print(JSON(_dumps(result).decode()))
                     
             else:
                 console.print("[red]✗ Pipeline failed![/red]")
@@ -1,6 +1,11 @@
 from rich.console import Console
 from rich.table import Table
 
+from src.cli.tui.agent_runner.agent_names import (
+    AGENT_COMPANY, AGENT_INDUSTRY, AGENT_MARKET_DATA, AGENT_COMPETITIVE,
+    AGENT_MARKET_GAP, AGENT_OPPORTUNITY, AGENT_REPORT
+)
+
 class AgentInfoHandler:
     """Handles agent information display"""
     
@@ -17,13 +22,13 @@ class AgentInfoHandler:
         info_table.add_column("Status", style="yellow")
         
         agent_info = {
-            "Company Research Agent": "Collect foundational company data",
-            "Industry Analysis Agent": "Identify expansion domains",
-            "Market Data Agent": "Fetch quantitative market metrics",
-            "Competitive Landscape Agent": "Map competitors and offerings",
-            "Market Gap Analysis Agent": "Detect unmet market needs",
-            "Opportunity Agent": "Generate growth opportunities",
-            "Report Synthesis Agent": "Compile final research report"
+            AGENT_COMPANY: "Collect foundational company data",
+            AGENT_INDUSTRY: "Identify expansion domains",
+            AGENT_MARKET_DATA: "Fetch quantitative market metrics",
+            AGENT_COMPETITIVE: "Map competitors and offerings",
+            AGENT_MARKET_GAP: "Detect unmet market needs",
+            AGENT_OPPORTUNITY: "Generate growth opportunities",
+            AGENT_REPORT: "Compile final research report"
         }
         
         for agent, purpose in agent_info.items():
@@ -11,6 +11,11 @@ from src.agents.market_gap_agent import run_market_gap_analysis_agent
 from src.agents.opportunity_agent import run_opportunity_agent
 from src.agents.report_synthesis_agent import run_report_synthesis_agent
 
+from .agent_names import (
+    AGENT_COMPANY, AGENT_INDUSTRY, AGENT_MARKET_DATA, AGENT_COMPETITIVE,
+    AGENT_MARKET_GAP, AGENT_OPPORTUNITY, AGENT_REPORT
+)
+
 
 class AgentExecutor:
     """Handles agent execution and data flow"""
@@ -21,23 +26,23 @@ class AgentExecutor:
     def execute_agent(self, agent_name: str, agent_input: Dict, selected_domain: str = None) -> Dict:
         """Execute actual agent based on agent type"""
         try:
-            if agent_name == "Company Research Agent":
+            if agent_name == AGENT_COMPANY:
                 company_name = agent_input.get("company_name", "")
                 response = run_company_research_agent(company_name)
                 
-            elif agent_name == "Industry Analysis Agent":
+            elif agent_name == AGENT_INDUSTRY:
                 company_data = agent_input.get("company_data")
                 if not company_data:
                     raise ValueError("Company data required from previous agent")
                 response = run_industry_analysis_agent(company_data)
                 
-            elif agent_name == "Market Data Agent":
+            elif agent_name == AGENT_MARKET_DATA:
                 domain = selected_domain or agent_input.get("domain", "")
                 if not domain:
                     raise ValueError("Domain required for market data analysis")
                 response = run_market_data_agent(domain)
                 
-            elif agent_name == "Competitive Landscape Agent":
+            elif agent_name == AGENT_COMPETITIVE:
                 if not selected_domain:
                     raise ValueError("Domain selection required from previous agent")
                 
@@ -49,19 +54,19 @@ class AgentExecutor:
                 }
                 response = run_competitive_landscape_agent(industry_opportunity)
                 
-            elif agent_name == "Market Gap Analysis Agent":
+            elif agent_name == AGENT_MARKET_GAP:
                 combined_data = agent_input.get("combined_data")
                 if not combined_data:
                     raise ValueError("Combined data required from previous agents")
                 response = run_market_gap_analysis_agent(combined_data)
                 
-            elif agent_name == "Opportunity Agent":
+            elif agent_name == AGENT_OPPORTUNITY:
                 gap_analysis = agent_input.get("gap_analysis")
                 if not gap_analysis:
                     raise ValueError("Gap analysis data required from previous agent")
                 response = run_opportunity_agent(gap_analysis)
                 
-            elif agent_name == "Report Synthesis Agent":
+            elif agent_name == AGENT_REPORT:
                 combined_data = agent_input.get("combined_data")
                 if not combined_data:
                     raise ValueError("Combined data required from all previous agents")
@@ -83,15 +88,15 @@ class AgentExecutor:
     
     def collect_agent_input(self, agent_name: str, agent_outputs: Dict, selected_domain: str = None) -> Optional[Dict]:
         """Collect input for the agent based on actual requirements"""
-        if agent_name == "Company Research Agent":
+        if agent_name == AGENT_COMPANY:
             company_name = Prompt.ask("Enter company name", default="")
             return {"company_name": company_name} if company_name else None
                 
-        elif agent_name == "Industry Analysis Agent":
-            company_data = self._get_data_from_agent("Company Research Agent", agent_outputs)
+        elif agent_name == AGENT_INDUSTRY:
+            company_data = self._get_data_from_agent(AGENT_COMPANY, agent_outputs)
             return {"company_data": company_data} if company_data else None
                 
-        elif agent_name == "Market Data Agent":
+        elif agent_name == AGENT_MARKET_DATA:
             if selected_domain:
                 use_selected = Confirm.ask(f"Use selected domain '{selected_domain}'?", default=True)
                 if use_selected:
@@ -100,16 +105,16 @@ class AgentExecutor:
             domain = Prompt.ask("Enter market domain to analyze", default="")
             return {"domain": domain} if domain else None
                 
-        elif agent_name == "Competitive Landscape Agent":
+        elif agent_name == AGENT_COMPETITIVE:
             if selected_domain:
                 self.console.print(f"[green]Using selected domain: {selected_domain}[/green]")
                 return {"auto_chain": True}
             return None
                 
-        elif agent_name == "Market Gap Analysis Agent":
-            company_profile = self._get_data_from_agent("Company Research Agent", agent_outputs)
-            competitor_list = self._get_data_from_agent("Competitive Landscape Agent", agent_outputs)
-            market_stats = self._get_data_from_agent("Market Data Agent", agent_outputs)
+        elif agent_name == AGENT_MARKET_GAP:
+            company_profile = self._get_data_from_agent(AGENT_COMPANY, agent_outputs)
+            competitor_list = self._get_data_from_agent(AGENT_COMPETITIVE, agent_outputs)
+            market_stats = self._get_data_from_agent(AGENT_MARKET_DATA, agent_outputs)
             
             if all([company_profile, competitor_list, market_stats]):
                 combined_data = {
@@ -120,18 +125,18 @@ class AgentExecutor:
                 return {"combined_data": combined_data}
             return None
                 
-        elif agent_name == "Opportunity Agent":
-            gap_analysis = self._get_data_from_agent("Market Gap Analysis Agent", agent_outputs)
+        elif agent_name == AGENT_OPPORTUNITY:
+            gap_analysis = self._get_data_from_agent(AGENT_MARKET_GAP, agent_outputs)
             return {"gap_analysis": gap_analysis} if gap_analysis else None
                 
-        elif agent_name == "Report Synthesis Agent":
+        elif agent_name == AGENT_REPORT:
             combined_data = {
-                "company_research_data": self._get_data_from_agent("Company Research Agent", agent_outputs),
-                "domain_research_data": self._get_data_from_agent("Industry Analysis Agent", agent_outputs),
-                "market_research_data": self._get_data_from_agent("Market Data Agent", agent_outputs),
-                "competitive_research_data": self._get_data_from_agent("Competitive Landscape Agent", agent_outputs),
-                "gap_analysis_data": self._get_data_from_agent("Market Gap Analysis Agent", agent_outputs),
-                "opportunity_research_data": self._get_data_from_agent("Opportunity Agent", agent_outputs)
+                "company_research_data": self._get_data_from_agent(AGENT_COMPANY, agent_outputs),
+                "domain_research_data": self._get_data_from_agent(AGENT_INDUSTRY, agent_outputs),
+                "market_research_data": self._get_data_from_agent(AGENT_MARKET_DATA, agent_outputs),
+                "competitive_research_data": self._get_data_from_agent(AGENT_COMPETITIVE, agent_outputs),
+                "gap_analysis_data": self._get_data_from_agent(AGENT_MARKET_GAP, agent_outputs),
+                "opportunity_research_data": self._get_data_from_agent(AGENT_OPPORTUNITY, agent_outputs)
             }
             return {"combined_data": combined_data}
         
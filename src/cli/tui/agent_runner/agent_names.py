@@ -0,0 +1,22 @@
+import sys
+
+# Agent display names double as keys for agent definitions, outputs and
+# validators. Interning them once lets dict lookups and `==` checks in the
+# TUI hot paths short-circuit on identity.
+AGENT_COMPANY = sys.intern("Company Research Agent")
+AGENT_INDUSTRY = sys.intern("Industry Analysis Agent")
+AGENT_MARKET_DATA = sys.intern("Market Data Agent")
+AGENT_COMPETITIVE = sys.intern("Competitive Landscape Agent")
+AGENT_MARKET_GAP = sys.intern("Market Gap Analysis Agent")
+AGENT_OPPORTUNITY = sys.intern("Opportunity Agent")
+AGENT_REPORT = sys.intern("Report Synthesis Agent")
+
+# Agents whose outputs feed the final report
+REPORT_INPUT_AGENTS = (
+    AGENT_COMPANY,
+    AGENT_INDUSTRY,
+    AGENT_MARKET_DATA,
+    AGENT_COMPETITIVE,
+    AGENT_MARKET_GAP,
+    AGENT_OPPORTUNITY,
+)
@@ -8,6 +8,11 @@ from rich.markdown import Markdown
 from rich.syntax import Syntax
 from rich.align import Align
 
+from .agent_names import (
+    AGENT_COMPANY, AGENT_INDUSTRY, AGENT_MARKET_DATA, AGENT_COMPETITIVE,
+    AGENT_MARKET_GAP, AGENT_OPPORTUNITY, AGENT_REPORT
+)
+
 
 class AgentOutputStyler:
     """Utility class for styling agent outputs"""
@@ -232,19 +237,19 @@ class AgentOutputStyler:
     def create_styled_data_display(agent_name: str, data: Any) -> str:
         """Create stylized display for agent data based on agent type"""
         try:
-            if agent_name == "Company Research Agent":
+            if agent_name == AGENT_COMPANY:
                 return AgentOutputStyler.style_company_data(data)
-            elif agent_name == "Industry Analysis Agent":
+            elif agent_name == AGENT_INDUSTRY:
                 return AgentOutputStyler.style_industry_data(data)
-            elif agent_name == "Market Data Agent":
+            elif agent_name == AGENT_MARKET_DATA:
                 return AgentOutputStyler.style_market_data(data)
-            elif agent_name == "Competitive Landscape Agent":
+            elif agent_name == AGENT_COMPETITIVE:
                 return AgentOutputStyler.style_competitive_data(data)
-            elif agent_name == "Market Gap Analysis Agent":
+            elif agent_name == AGENT_MARKET_GAP:
                 return AgentOutputStyler.style_gap_analysis_data(data)
-            elif agent_name == "Opportunity Agent":
+            elif agent_name == AGENT_OPPORTUNITY:
                 return AgentOutputStyler.style_opportunity_data(data)
-            elif agent_name == "Report Synthesis Agent":
+            elif agent_name == AGENT_REPORT:
                 return AgentOutputStyler.style_report_data(data)
             else:
                 return json.dumps(data, indent=2)
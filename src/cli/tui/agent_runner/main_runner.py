@@ -1,6 +1,7 @@
 import json
 from typing import Dict, Any, Optional, List
 from rich.console import Console
+from rich.control import Control
 from rich.panel import Panel
 from rich.text import Text
 from rich.layout import Layout
@@ -14,12 +15,17 @@ from src.utils.models import (
 )
 
 from src.utils.validation import (
-    CompanyValidator, IndustryAnalysisValidator, MarketDataValidator,
-    CompetitiveLandscapeValidator, MarketGapAnalysisValidator,
-    OpportunityValidator, ReportSynthesisValidator
+    COMPANY_VALIDATOR, INDUSTRY_ANALYSIS_VALIDATOR, MARKET_DATA_VALIDATOR,
+    COMPETITIVE_LANDSCAPE_VALIDATOR, MARKET_GAP_ANALYSIS_VALIDATOR,
+    OPPORTUNITY_VALIDATOR, REPORT_SYNTHESIS_VALIDATOR
 )
 
 from .display_utils import AgentOutputStyler, TUIComponentBuilder
+from .agent_names import (
+    AGENT_COMPANY, AGENT_INDUSTRY, AGENT_MARKET_DATA, AGENT_COMPETITIVE,
+    AGENT_MARKET_GAP, AGENT_OPPORTUNITY, AGENT_REPORT,
+    REPORT_INPUT_AGENTS
+)
 from .agent_executor import AgentExecutor
 from .report_handler import ReportHandler
 from .system_status import SystemStatusHandler
@@ -51,19 +57,19 @@ class IndividualAgentRunner:
     def _initialize_validators(self):
         """Initialize validators for each agent"""
         self.validators = {
-            "Company Research Agent": CompanyValidator(),
-            "Industry Analysis Agent": IndustryAnalysisValidator(),
-            "Market Data Agent": MarketDataValidator(),
-            "Competitive Landscape Agent": CompetitiveLandscapeValidator(),
-            "Market Gap Analysis Agent": MarketGapAnalysisValidator(),
-            "Opportunity Agent": OpportunityValidator(),
-            "Report Synthesis Agent": ReportSynthesisValidator()
+            AGENT_COMPANY: COMPANY_VALIDATOR,
+            AGENT_INDUSTRY: INDUSTRY_ANALYSIS_VALIDATOR,
+            AGENT_MARKET_DATA: MARKET_DATA_VALIDATOR,
+            AGENT_COMPETITIVE: COMPETITIVE_LANDSCAPE_VALIDATOR,
+            AGENT_MARKET_GAP: MARKET_GAP_ANALYSIS_VALIDATOR,
+            AGENT_OPPORTUNITY: OPPORTUNITY_VALIDATOR,
+            AGENT_REPORT: REPORT_SYNTHESIS_VALIDATOR
         }
     
     def _get_agent_definitions(self) -> Dict[str, Dict[str, Any]]:
         """Define all available agents with their actual specifications"""
         return {
-            "Company Research Agent": {
+            AGENT_COMPANY: {
                 "description": """
 ## Company Research Agent
 
@@ -90,9 +96,9 @@ class IndividualAgentRunner:
                 },
                 "request_model": CompanyResearchRequest,
                 "response_model": CompanyResponse,
-                "next_agent": "Industry Analysis Agent"
+                "next_agent": AGENT_INDUSTRY
             },
-            "Industry Analysis Agent": {
+            AGENT_INDUSTRY: {
                 "description": """
 ## Industry Analysis Agent
 
@@ -118,9 +124,9 @@ class IndividualAgentRunner:
                 },
                 "request_model": CompanyResponse,
                 "response_model": IndustryAnalysisResponse,
-                "next_agent": "Market Data Agent"
+                "next_agent": AGENT_MARKET_DATA
             },
-            "Market Data Agent": {
+            AGENT_MARKET_DATA: {
                 "description": """
 ## Market Data Agent
 
@@ -146,9 +152,9 @@ class IndividualAgentRunner:
                 },
                 "request_model": MarketDataRequest,
                 "response_model": MarketDataResponse,
-                "next_agent": "Competitive Landscape Agent"
+                "next_agent": AGENT_COMPETITIVE
             },
-            "Competitive Landscape Agent": {
+            AGENT_COMPETITIVE: {
                 "description": """
 ## Competitive Landscape Agent
 
@@ -176,9 +182,9 @@ class IndividualAgentRunner:
                 },
                 "request_model": "InferredFromContext",
                 "response_model": CompetitiveLandscapeResponse,
-                "next_agent": "Market Gap Analysis Agent"
+                "next_agent": AGENT_MARKET_GAP
             },
-            "Market Gap Analysis Agent": {
+            AGENT_MARKET_GAP: {
                 "description": """
 ## Market Gap Analysis Agent
 
@@ -208,9 +214,9 @@ class IndividualAgentRunner:
                 },
                 "request_model": MarketGapAnalysisRequest,
                 "response_model": MarketGapAnalysisResponse,
-                "next_agent": "Opportunity Agent"
+                "next_agent": AGENT_OPPORTUNITY
             },
-            "Opportunity Agent": {
+            AGENT_OPPORTUNITY: {
                 "description": """
 ## Opportunity Agent
 
@@ -238,9 +244,9 @@ class IndividualAgentRunner:
                 },
                 "request_model": "InferredFromGaps",
                 "response_model": OpportunityResponse,
-                "next_agent": "Report Synthesis Agent"
+                "next_agent": AGENT_REPORT
             },
-            "Report Synthesis Agent": {
+            AGENT_REPORT: {
                 "description": """
 ## Report Synthesis Agent
 
@@ -383,7 +389,7 @@ class IndividualAgentRunner:
     def _is_report_synthesis_agent(self) -> bool:
         """Check if current agent is Report Synthesis Agent"""
         current_agent_name = list(self.agents.keys())[self.current_agent_index]
-        return current_agent_name == "Report Synthesis Agent"
+        return current_agent_name == AGENT_REPORT
     
     def _get_available_tabs(self) -> List[str]:
         """Get available tabs based on current agent"""
@@ -426,8 +432,10 @@ class IndividualAgentRunner:
             Layout(self._create_tab_content())
         )
         
-        # Clear and print in one operation
-        self.console.clear()
+        # Home the cursor and paint over the previous frame instead of clearing
+        # the screen; the full-screen layout overwrites every cell, so there is
+        # no flicker and no clear-screen sequence per keypress
+        self.console.control(Control.home())
         self.console.print(layout)
 
     def _create_tab_content(self) -> Panel:
@@ -462,10 +470,7 @@ class IndividualAgentRunner:
             content.append("❌ Cannot Generate Report\n\n", style="bold red")
             content.append("Missing data from required agents:\n", style="yellow")
             
-            required_agents = [
-                "Company Research Agent", "Industry Analysis Agent", "Market Data Agent",
-                "Competitive Landscape Agent", "Market Gap Analysis Agent", "Opportunity Agent"
-            ]
+            required_agents = REPORT_INPUT_AGENTS
             
             for agent in required_agents:
                 if agent not in self.agent_outputs or not self.agent_outputs[agent].get("success"):
@@ -638,7 +643,7 @@ class IndividualAgentRunner:
                 self.console.print(f"[green]✓ {current_agent_name} completed successfully![/green]")
                 
                 # Handle domain selection after Industry Analysis
-                if current_agent_name == "Industry Analysis Agent" and output.get("success"):
+                if current_agent_name == AGENT_INDUSTRY and output.get("success"):
                     selected = self.executor.handle_domain_selection(output.get("data", []))
                     if selected:
                         self.selected_domain = selected
@@ -656,7 +661,7 @@ class IndividualAgentRunner:
             self.current_agent_index = i
             self.console.print(f"[blue]Running {agent_name}...[/blue]")
             
-            if agent_name == "Company Research Agent":
+            if agent_name == AGENT_COMPANY:
                 company_name = Prompt.ask("Enter company name for chain execution")
                 agent_input = {"company_name": company_name}
             else:
@@ -670,7 +675,7 @@ class IndividualAgentRunner:
                     self.agent_outputs[agent_name] = output
                     self.console.print(f"[green]✓ {agent_name} completed successfully[/green]")
                     
-                    if agent_name == "Industry Analysis Agent" and output.get("success"):
+                    if agent_name == AGENT_INDUSTRY and output.get("success"):
                         selected = self.executor.handle_domain_selection(output.get("data", []))
                         if selected:
                             self.selected_domain = selected
@@ -749,8 +754,8 @@ class IndividualAgentRunner:
             validation_result = validator.validate_output(output["data"])
             
             return {
-                "is_valid": validation_result.get("valid", False),
-                "issues": [validation_result.get("error", "Unknown validation error")] if not validation_result.get("valid", False) else [],
+                "is_valid": validation_result.valid,
+                "issues": [validation_result.error or "Unknown validation error"] if not validation_result.valid else [],
                 "schema_used": agent_name
             }
             
@@ -8,6 +8,11 @@ from datetime import datetime
 
 from src.agents.report_synthesis_agent import create_pdf_stream
 
+from .agent_names import (
+    AGENT_COMPANY, AGENT_INDUSTRY, AGENT_MARKET_DATA, AGENT_COMPETITIVE,
+    AGENT_MARKET_GAP, AGENT_OPPORTUNITY, REPORT_INPUT_AGENTS
+)
+
 
 class ReportHandler:
     """Handles report synthesis and PDF generation"""
@@ -17,14 +22,7 @@ class ReportHandler:
     
     def can_generate_report(self, agent_outputs: Dict[str, Any]) -> bool:
         """Check if all required agent outputs are available for report generation"""
-        required_agents = [
-            "Company Research Agent",
-            "Industry Analysis Agent", 
-            "Market Data Agent",
-            "Competitive Landscape Agent",
-            "Market Gap Analysis Agent",
-            "Opportunity Agent"
-        ]
+        required_agents = REPORT_INPUT_AGENTS
         
         for agent in required_agents:
             if agent not in agent_outputs:
@@ -40,7 +38,7 @@ class ReportHandler:
             return "❌ Cannot generate report: Missing required agent data\n\nRequired agents:\n- Company Research Agent\n- Industry Analysis Agent\n- Market Data Agent\n- Competitive Landscape Agent\n- Market Gap Analysis Agent\n- Opportunity Agent"
         
         # Get company name for title
-        company_name = agent_outputs.get("Company Research Agent", {}).get("data", {}).get("name", "Unknown Company")
+        company_name = agent_outputs.get(AGENT_COMPANY, {}).get("data", {}).get("name", "Unknown Company")
         
         report = f"📋 COMPREHENSIVE MARKET RESEARCH REPORT\n"
         report += f"{'='*60}\n\n"
@@ -48,7 +46,7 @@ class ReportHandler:
         report += f"Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}\n\n"
         
         # Company Overview
-        company_data = agent_outputs["Company Research Agent"]["data"]
+        company_data = agent_outputs[AGENT_COMPANY]["data"]
         report += "🏢 COMPANY OVERVIEW\n"
         report += f"{'-'*30}\n"
         report += f"Industry: {company_data.get('industry', 'N/A')}\n"
@@ -64,7 +62,7 @@ class ReportHandler:
         report += "\n"
         
         # Industry Analysis Summary
-        industry_data = agent_outputs["Industry Analysis Agent"]["data"]
+        industry_data = agent_outputs[AGENT_INDUSTRY]["data"]
         if industry_data:
             report += "🎯 INDUSTRY OPPORTUNITIES\n"
             report += f"{'-'*30}\n"
@@ -75,7 +73,7 @@ class ReportHandler:
                 report += f"   {opp.get('rationale', 'No rationale')}\n\n"
         
         # Market Statistics
-        market_data = agent_outputs["Market Data Agent"]["data"]
+        market_data = agent_outputs[AGENT_MARKET_DATA]["data"]
         report += "📊 MARKET STATISTICS\n"
         report += f"{'-'*30}\n"
         market_size = market_data.get('market_size_usd', 0)
@@ -101,7 +99,7 @@ class ReportHandler:
         report += "\n"
         
         # Competitive Landscape Summary
-        competitive_data = agent_outputs["Competitive Landscape Agent"]["data"]
+        competitive_data = agent_outputs[AGENT_COMPETITIVE]["data"]
         if competitive_data:
             report += "🏆 TOP COMPETITORS\n"
             report += f"{'-'*30}\n"
@@ -113,7 +111,7 @@ class ReportHandler:
                 report += f"   Position: {comp.get('note', 'N/A')}\n\n"
         
         # Market Gaps Summary
-        gap_data = agent_outputs["Market Gap Analysis Agent"]["data"]
+        gap_data = agent_outputs[AGENT_MARKET_GAP]["data"]
         if gap_data:
             high_impact_gaps = [gap for gap in gap_data if gap.get('impact', '').lower() == 'high']
             if high_impact_gaps:
@@ -124,7 +122,7 @@ class ReportHandler:
                     report += f"   Evidence: {gap.get('evidence', 'No evidence')}\n\n"
         
         # Strategic Opportunities Summary  
-        opportunity_data = agent_outputs["Opportunity Agent"]["data"]
+        opportunity_data = agent_outputs[AGENT_OPPORTUNITY]["data"]
         if opportunity_data:
             high_priority_opps = [opp for opp in opportunity_data if opp.get('priority', '').lower() == 'high']
             if high_priority_opps:
@@ -167,12 +165,12 @@ class ReportHandler:
             
             # Prepare data for PDF generation
             combined_data = {
-                "company_research_data": agent_outputs["Company Research Agent"]["data"],
-                "domain_research_data": agent_outputs["Industry Analysis Agent"]["data"],
-                "market_research_data": agent_outputs["Market Data Agent"]["data"],
-                "competitive_research_data": agent_outputs["Competitive Landscape Agent"]["data"],
-                "gap_analysis_data": agent_outputs["Market Gap Analysis Agent"]["data"],
-                "opportunity_research_data": agent_outputs["Opportunity Agent"]["data"]
+                "company_research_data": agent_outputs[AGENT_COMPANY]["data"],
+                "domain_research_data": agent_outputs[AGENT_INDUSTRY]["data"],
+                "market_research_data": agent_outputs[AGENT_MARKET_DATA]["data"],
+                "competitive_research_data": agent_outputs[AGENT_COMPETITIVE]["data"],
+                "gap_analysis_data": agent_outputs[AGENT_MARKET_GAP]["data"],
+                "opportunity_research_data": agent_outputs[AGENT_OPPORTUNITY]["data"]
             }
             
             # Generate PDF
@@ -200,10 +198,7 @@ class ReportHandler:
             return "\n💾 [S] Save PDF Report - Generate and save comprehensive PDF report"
         else:
             missing_agents = []
-            required_agents = [
-                "Company Research Agent", "Industry Analysis Agent", "Market Data Agent",
-                "Competitive Landscape Agent", "Market Gap Analysis Agent", "Opportunity Agent"
-            ]
+            required_agents = REPORT_INPUT_AGENTS
             
             for agent in required_agents:
                 if agent not in agent_outputs or not agent_outputs[agent].get("success"):
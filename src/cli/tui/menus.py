@@ -9,11 +9,17 @@ class MainMenuHandler:
     
     def __init__(self, console: Console):
         self.console = console
+        # The menu never changes, so build it once and reprint it on every visit
+        self._layout = self._build_layout()
         
     def show_main_menu(self):
         """Display the main menu"""
         #self.console.clear()
         
+        self.console.print(self._layout)
+        
+    def _build_layout(self) -> Layout:
+        """Build the static main menu layout"""
         # Create header
         header = Text("Ambitus", style="bold blue")
         header.append(" - Market Research Automation Platform", style="italic")
@@ -35,8 +41,7 @@ Choose an option:"""
             Layout(Panel(header, style="blue"), size=3),
             Layout(Panel(menu_text, title="Options", style="green"))
         )
-        
-        self.console.print(layout)
+        return layout
         
     def get_user_choice(self) -> str:
         """Get user input choice"""
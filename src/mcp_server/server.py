@@ -18,7 +18,7 @@ except ImportError as e:
 try:
     from src.mcp_server.tools.ping_tool import ping_tool
     from src.mcp_server.tools.search_tool import search_tool
-    from src.mcp_server.tools.citation_agent_tool import citation_agent
+    from src.mcp_server.tools.citation_agent_tool import citation_agent, citation_agent_batch
     TOOLS_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Some tools could not be imported: {e}")
@@ -34,6 +34,7 @@ if TOOLS_AVAILABLE:
         mcp.add_tool(ping_tool)
         mcp.add_tool(search_tool)
         mcp.add_tool(citation_agent)
+        mcp.add_tool(citation_agent_batch)
     except Exception as e:
         print(f"Warning: Error registering tools: {e}")
 
@@ -44,9 +45,22 @@ async def health_check(request: Request) -> PlainTextResponse:
     """
     return PlainTextResponse("OK")
 
+def _install_uvloop() -> None:
+    """Use uvloop for the server's event loop when available (set MCP_UVLOOP=0 to disable)"""
+    if os.getenv('MCP_UVLOOP', '1') == '0':
+        return
+    try:
+        import uvloop
+    except ImportError:
+        # uvloop is not available on Windows; fall back to the default loop
+        return
+    uvloop.install()
+
 def main():
     """Start the MCP server with SSE transport"""
     try:
+        _install_uvloop()
+        
         # Get host and port from environment variables
         host = os.getenv('MCP_HOST', 'localhost')
         port = int(os.getenv('MCP_PORT', '8000'))
@@ -1,95 +1,24 @@
 # Library Import
-from haystack.components.generators.chat import OpenAIChatGenerator
-from haystack_integrations.tools.mcp import MCPTool, SSEServerInfo, MCPToolset
-from haystack.components.agents import Agent
-from haystack.dataclasses import ChatMessage
-from typing import Any,Dict
-from haystack.utils import Secret
+import asyncio
+import threading
 import os
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import orjson
 from dotenv import load_dotenv
 
-from typing import List
-from haystack import component, Document, Pipeline, SuperComponent
-from haystack.components.fetchers import LinkContentFetcher
-from haystack.components.converters import MultiFileConverter
-from haystack.components.builders.chat_prompt_builder import ChatPromptBuilder
-from duckduckgo_api_haystack import DuckduckgoApiWebSearch
-from haystack.dataclasses import ChatMessage, ToolCall
-from haystack.components.tools import ToolInvoker
-from haystack.tools import Tool
-from haystack.tools import ComponentTool
-
-# Importing the 'search_tool' module's Haystack Pipeline Implementation
-from .search_tool import search_pipe
-
-
+from src.utils.cache import TTLCache, make_key
 
+# Haystack, the OpenAI client and the search pipeline are imported lazily in
+# create_citation_agent() so the MCP server does not pay for them at startup
+# unless this tool is actually called.
+if TYPE_CHECKING:
+    from haystack.components.agents import Agent
 
 load_dotenv()
 key = os.getenv("OPENAI_API_KEY")
 
-# web search pipeline made into a component(superComponent) made into a tool(componentTool)
-
-
-# Citation_agent
-def citation_agent(claim: str, context: str) -> dict[str, Any]:
-    """
-    Generate a citation for a given claim and context.
-
-    Args:
-        claim: The claim to be cited.
-        context: The context or source of the claim.
-        
-    Returns:
-        Dict containing the citation information
-    """
-    @component
-    class DocumentFormatter:
-        """
-        Takes a list of Documents and returns two lists of strings:
-          - `sources`:  ["Source 1: <url1>", "Source 2: <url2>", …]
-          - `information`: ["Information 1: <content1>", …]
-        """
-        @component.output_types(sources=List[str], information=List[str])
-        def run(self, documents: List[Document]):
-            sources: List[str] = []
-            information: List[str] = []
-            for idx, doc in enumerate(documents, start=1):
-                url = doc.meta.get("url", "<no-url>")
-                sources.append(f"Source {idx}: {url}")
-                information.append(f"Information {idx}: {doc.content}")
-            return {"sources": sources, "information": information}
-
-    search_pipe_component = SuperComponent(
-        pipeline=search_pipe
-    )
-
-    search_tool = ComponentTool(
-        component=search_pipe_component,
-        name="search_tool", 
-        description="Search the web for current information on any topic."
-    )
-    
-    
-    llm = OpenAIChatGenerator(
-        model="o4-mini",
-        api_key=Secret.from_token(token=key)
-    )
-    
-    # server_info = SSEServerInfo(
-    #     base_url="http://localhost:8000",
-    # )
-
-    # search_tool = MCPTool(name="search_tool", server_info=server_info)
-    tools = [search_tool]
-
-    agent = Agent(
-        chat_generator = llm,
-        tools = tools
-    )
-
-    # Prompting the Agent
-    system_prompt = """
+# Prompting the Agent
+SYSTEM_PROMPT = """
     You are a citation-checking assistant. Given a "claim" and a "context", verify whether the claim is supported by the context or by external sources. Return exactly this format:
 
     {
@@ -167,16 +96,113 @@ def citation_agent(claim: str, context: str) -> dict[str, Any]:
 
     """
 
-    sys = ChatMessage.from_system(system_prompt)
-    claim_ip = ChatMessage.from_user(claim)
-    context_ip = ChatMessage.from_user(context)
-    messages = [sys,claim_ip,context_ip]
+BATCH_SYSTEM_PROMPT = """
+    You are a citation-checking assistant. You receive a JSON array where every item has a "claim", a "context" and "evidence" gathered from a web search for that claim (a JSON array of {"url", "content"} documents). For every item, verify whether the claim is supported by its context or by its evidence.
+
+    Return only a JSON array with exactly one object per input item, in the same order, each in this format:
+
+    {
+      "claim": <the claim, verbatim>,
+      "claim_valid": <true|false>,
+      "citations": [
+        {
+          "title": <string>,
+          "url": <string>,
+          "snippet": <excerpt supporting or refuting the claim>
+        },
+        ... zero or more items
+      ]
+    }
+
+    Only cite URLs that appear in the evidence. No text outside the JSON array.
+    """
+
+
+# web search pipeline made into a component(superComponent) made into a tool(componentTool)
+def create_citation_agent() -> "Agent":
+    """Create and warm up the citation-checking Haystack Agent"""
+    from haystack import SuperComponent
+    from haystack.components.agents import Agent
+    from haystack.components.generators.chat import OpenAIChatGenerator
+    from haystack.tools import ComponentTool
+    from haystack.utils import Secret
+
+    # Importing the 'search_tool' module's Haystack Pipeline Implementation
+    from .search_tool import search_pipe
+
+    search_pipe_component = SuperComponent(
+        pipeline=search_pipe
+    )
 
+    search_tool = ComponentTool(
+        component=search_pipe_component,
+        name="search_tool", 
+        description="Search the web for current information on any topic."
+    )
+
+    llm = OpenAIChatGenerator(
+        model="o4-mini",
+        api_key=Secret.from_token(token=key)
+    )
+
+    agent = Agent(
+        chat_generator = llm,
+        tools = [search_tool]
+    )
     agent.warm_up()
+    return agent
+
+
+# Verified citations keyed by (claim, context); only successful results are stored
+_CITATION_CACHE = TTLCache(maxsize=1024, ttl=3600)
+
+_AGENT: Optional["Agent"] = None
+_AGENT_LOCK = threading.Lock()
+
+
+def _get_agent() -> "Agent":
+    """Return the shared citation agent, building it on first use"""
+    global _AGENT
+    if _AGENT is None:
+        with _AGENT_LOCK:
+            if _AGENT is None:
+                _AGENT = create_citation_agent()
+    return _AGENT
+
+
+# Citation_agent
+async def citation_agent(claim: str, context: str) -> dict[str, Any]:
+    """
+    Generate a citation for a given claim and context.
+
+    Args:
+        claim: The claim to be cited.
+        context: The context or source of the claim.
+        
+    Returns:
+        Dict containing the citation information
+    """
+    cache_key = make_key(claim, context)
+    cached = _CITATION_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    from haystack.dataclasses import ChatMessage
+
+    messages = [
+        ChatMessage.from_system(SYSTEM_PROMPT),
+        ChatMessage.from_user(claim),
+        ChatMessage.from_user(context),
+    ]
 
     try:
-        response = agent.run(messages=messages)
-        return response['messages'][-1].texts
+        # Agent construction and the agent loop (search, fetch, LLM calls) are
+        # blocking, so keep them off the event loop serving the SSE transport
+        agent = await asyncio.to_thread(_get_agent)
+        response = await asyncio.to_thread(agent.run, messages=messages)
+        texts = response['messages'][-1].texts
+        _CITATION_CACHE.set(cache_key, texts)
+        return texts
     except Exception as e:
         return {
             "claim_valid": False,
@@ -184,11 +210,145 @@ def citation_agent(claim: str, context: str) -> dict[str, Any]:
             "error": str(e)
         }
 
+def _strip_code_fence(text: str, opening: str) -> str:
+    """Drop a code fence wrapped around the model's JSON reply, if any"""
+    text = text.strip()
+    if text.startswith("```"):
+        text = text.strip("`")
+        text = text[text.find(opening):]
+    return text
+
+
+def _parse_json_array(text: str) -> List[Dict[str, Any]]:
+    """Parse the model's JSON array reply, tolerating a surrounding code fence"""
+    parsed = orjson.loads(_strip_code_fence(text, "["))
+    if not isinstance(parsed, list):
+        raise ValueError("Expected a JSON array of citation results")
+    return parsed
+
+
+def _to_citation_dict(claim: str, result: Any) -> Dict[str, Any]:
+    """
+    Turn a citation_agent result (the reply texts, or an error dict) into the
+    citation dict shape returned by citation_agent_batch.
+    """
+    if isinstance(result, dict):
+        return {**result, "claim": claim}
+    try:
+        parsed = orjson.loads(_strip_code_fence(result[-1], "{"))
+        if not isinstance(parsed, dict):
+            raise ValueError("Expected a JSON object citation result")
+    except Exception as e:
+        return {
+            "claim_valid": False,
+            "claim": claim,
+            "error": f"Could not parse citation result: {e}"
+        }
+    return {**parsed, "claim": claim}
+
+
+# Claims verified per LLM call, and characters of each evidence document sent
+# with them, so a large batch cannot overflow the model's context window
+_BATCH_SIZE = 10
+_MAX_EVIDENCE_CHARS = 2000
+
+
+def _truncate_evidence(docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Cap the content of every evidence document at _MAX_EVIDENCE_CHARS"""
+    return [
+        {**doc, "content": doc["content"][:_MAX_EVIDENCE_CHARS]}
+        if len(doc.get("content") or "") > _MAX_EVIDENCE_CHARS else doc
+        for doc in docs
+    ]
+
+
+async def _verify_chunk(chunk: List[Tuple[str, str]], evidence: Dict[str, List[dict]]) -> List[Dict[str, Any]]:
+    """
+    Verify one chunk of claims with a single LLM call, falling back to one
+    citation_agent call per claim if the reply cannot be matched to the input.
+    """
+    from haystack.dataclasses import ChatMessage
+
+    payload = [
+        {"claim": claim, "context": context, "evidence": _truncate_evidence(evidence.get(claim, []))}
+        for claim, context in chunk
+    ]
+    messages = [
+        ChatMessage.from_system(BATCH_SYSTEM_PROMPT),
+        ChatMessage.from_user(orjson.dumps(payload).decode()),
+    ]
+
+    try:
+        agent = await asyncio.to_thread(_get_agent)
+        response = await asyncio.to_thread(agent.chat_generator.run, messages=messages)
+        results = _parse_json_array(response["replies"][-1].text)
+    except Exception:
+        results = None
+
+    # Results are matched to claims by position, so a dropped or extra item
+    # would misattribute every citation after it
+    if results is None or len(results) != len(chunk):
+        fallback = await asyncio.gather(
+            *(citation_agent(claim, context) for claim, context in chunk)
+        )
+        return [_to_citation_dict(claim, result) for (claim, _), result in zip(chunk, fallback)]
+    return results
+
+
+async def citation_agent_batch(claims: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Generate citations for many claim-context pairs, verifying up to
+    _BATCH_SIZE pairs per LLM call.
+
+    Args:
+        claims: List of (claim, context) pairs to verify.
+
+    Returns:
+        List of citation dicts, one per input pair and in the same order
+    """
+    if not claims:
+        return []
+
+    # Batch results are citation dicts, unlike citation_agent's reply texts,
+    # so they are cached under their own keys
+    keys = [make_key("batch", claim, context) for claim, context in claims]
+    results: List[Optional[Dict[str, Any]]] = [_CITATION_CACHE.get(key) for key in keys]
+    pending = [i for i, result in enumerate(results) if result is None]
+    if not pending:
+        return results
+    pending_claims = [claims[i] for i in pending]
+
+    try:
+        from .search_tool import search_batch
+
+        # One web search per unique claim; pages shared between claims are
+        # fetched once
+        evidence = await search_batch([claim for claim, _ in pending_claims])
+    except Exception as e:
+        for i in pending:
+            results[i] = {
+                "claim_valid": False,
+                "claim": claims[i][0],
+                "error": str(e)
+            }
+        return results
+
+    chunks = [pending_claims[i:i + _BATCH_SIZE] for i in range(0, len(pending_claims), _BATCH_SIZE)]
+    chunk_results = await asyncio.gather(*(_verify_chunk(chunk, evidence) for chunk in chunks))
+    verified = [result for chunk_result in chunk_results for result in chunk_result]
+    for i, result in zip(pending, verified):
+        results[i] = result
+        if isinstance(result, dict) and "error" not in result:
+            _CITATION_CACHE.set(keys[i], result)
+    return results
+
 # Configuring function metadata for FastMCP
 citation_agent.__name__ = "claim_context_based_citation_tool"
 citation_agent.__doc__ = "Does a web search, extract necessary information and return a formatted citation for a given claim-context pair."
 citation_agent.connection_timeout = 60
 citation_agent.invocation_timeout = 60
 
-
-
+citation_agent_batch.__name__ = "batch_claim_context_based_citation_tool"
+citation_agent_batch.__doc__ = "Verifies many claim-context pairs at once: one web search per unique claim and one LLM call per batch of pairs, returning a citation per pair."
+citation_agent_batch.connection_timeout = 60
+citation_agent_batch.invocation_timeout = 120
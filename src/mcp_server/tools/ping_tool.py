@@ -1,6 +1,6 @@
 from typing import Any, Dict
 
-def ping_tool(message: str = "ping") -> Dict[str, Any]:
+async def ping_tool(message: str = "ping") -> Dict[str, Any]:
     """
     Echo back any input message - useful for testing connectivity
     
@@ -1,73 +1,265 @@
 # Generic Pipeline Imports
-from haystack import Pipeline
-from haystack.components.fetchers import LinkContentFetcher
-from haystack.components.converters import MultiFileConverter
+import asyncio
+import atexit
+import string
+import threading
+import time
+from haystack import AsyncPipeline, Pipeline
+import httpx
+from haystack.components.converters import HTMLToDocument
 from haystack.components.builders.chat_prompt_builder import ChatPromptBuilder
 from duckduckgo_api_haystack import DuckduckgoApiWebSearch
 
 # Custom Component Imports
-from typing import List
+from typing import Dict, List, NamedTuple, Optional, Tuple
 from haystack import component, Document
+from haystack.dataclasses import ByteStream
+
+from src.utils.cache import TTLCache, make_key
+
+# Shared HTTP connection pool for every search call. An AsyncClient is bound to
+# the event loop that uses it, so it lives on one dedicated background loop and
+# pipeline runs (which happen in worker threads) submit their fetches to it.
+_HTTP: Optional[httpx.AsyncClient] = None
+_HTTP_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_HTTP_LOCK = threading.Lock()
+
+
+def _close_http_client() -> None:
+    """Close the shared client and stop its event loop at interpreter exit"""
+    if _HTTP is not None and _HTTP_LOOP is not None:
+        asyncio.run_coroutine_threadsafe(_HTTP.aclose(), _HTTP_LOOP).result(timeout=5)
+        _HTTP_LOOP.call_soon_threadsafe(_HTTP_LOOP.stop)
+
+
+def _get_http_client(timeout: int) -> Tuple[httpx.AsyncClient, asyncio.AbstractEventLoop]:
+    """Return the shared client and the loop it runs on, starting both on first use"""
+    global _HTTP, _HTTP_LOOP
+    if _HTTP is None:
+        with _HTTP_LOCK:
+            if _HTTP is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="search-http", daemon=True).start()
+                _HTTP_LOOP = loop
+                _HTTP = httpx.AsyncClient(
+                    timeout=timeout,
+                    follow_redirects=True,
+                    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+                    headers={"User-Agent": "ambitus-search/1.0"},
+                )
+                atexit.register(_close_http_client)
+    return _HTTP, _HTTP_LOOP
+
+
+# Fetched pages keyed by URL hash. Entries younger than _PAGE_FRESH_SECONDS are
+# served as-is; older ones are kept for a day so their ETag can be revalidated.
+class _CachedPage(NamedTuple):
+    etag: Optional[str]
+    stream: ByteStream
+    fetched_at: float
+
+
+_PAGE_CACHE = TTLCache(maxsize=256, ttl=24 * 3600)
+_PAGE_FRESH_SECONDS = 3600
+
+
+# Custom Component to fetch all result links concurrently
+@component
+class AsyncLinkContentFetcher:
+    """
+    Drop-in replacement for LinkContentFetcher that downloads every URL
+    concurrently over a shared keep-alive connection pool instead of one
+    after another. Failed URLs are skipped.
+    """
+    def __init__(self, timeout: int = 3, retry_attempts: int = 2, max_concurrency: int = 8):
+        self.timeout = timeout
+        self.retry_attempts = retry_attempts
+        self.max_concurrency = max_concurrency
+
+    @component.output_types(streams=List[ByteStream])
+    def run(self, urls: List[str]):
+        if not urls:
+            return {"streams": []}
+        client, loop = _get_http_client(self.timeout)
+        streams = asyncio.run_coroutine_threadsafe(self._gather(client, urls), loop).result()
+        return {"streams": [stream for stream in streams if stream is not None]}
+
+    @component.output_types(streams=List[ByteStream])
+    async def run_async(self, urls: List[str]):
+        if not urls:
+            return {"streams": []}
+        client, loop = _get_http_client(self.timeout)
+        streams = await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(self._gather(client, urls), loop)
+        )
+        return {"streams": [stream for stream in streams if stream is not None]}
+
+    async def _gather(self, client: httpx.AsyncClient, urls: List[str]) -> List[Optional[ByteStream]]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        return await asyncio.gather(*(self._fetch(client, semaphore, url) for url in urls))
+
+    async def _fetch(self, client: httpx.AsyncClient, semaphore: asyncio.Semaphore, url: str) -> Optional[ByteStream]:
+        cache_key = make_key(url)
+        cached = _PAGE_CACHE.get(cache_key)
+        if cached is not None and time.monotonic() - cached.fetched_at < _PAGE_FRESH_SECONDS:
+            return cached.stream
+
+        # Stale pages with an ETag are revalidated instead of downloaded again
+        headers = {"If-None-Match": cached.etag} if cached is not None and cached.etag else None
+        async with semaphore:
+            for _ in range(self.retry_attempts + 1):
+                try:
+                    response = await client.get(url, timeout=self.timeout, headers=headers)
+                    if response.status_code == 304 and cached is not None:
+                        _PAGE_CACHE.set(cache_key, cached._replace(fetched_at=time.monotonic()))
+                        return cached.stream
+                    response.raise_for_status()
+                except httpx.HTTPError:
+                    continue
+                content_type = response.headers.get("Content-Type", "text/html").split(";")[0].strip()
+                stream = ByteStream(
+                    data=response.content,
+                    mime_type=content_type,
+                    meta={"url": url, "content_type": content_type},
+                )
+                _PAGE_CACHE.set(cache_key, _CachedPage(response.headers.get("ETag"), stream, time.monotonic()))
+                return stream
+        return None
+
+# Recent search results keyed by normalized query
+_SEARCH_CACHE = TTLCache(maxsize=512, ttl=24 * 3600)
+_PUNCTUATION = str.maketrans("", "", string.punctuation)
+
+
+def _normalize_query(query: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace so near-identical queries share a cache entry"""
+    return " ".join(query.lower().translate(_PUNCTUATION).split())
+
+
+# Custom Component to reuse recent DuckDuckGo results
+@component
+class CachedDuckduckgo:
+    """
+    Wraps DuckduckgoApiWebSearch with a day-long cache so repeated
+    queries (e.g. one claim checked against several contexts) skip the
+    web round-trip.
+    """
+    def __init__(self, **search_kwargs):
+        self.search = DuckduckgoApiWebSearch(**search_kwargs)
+
+    @component.output_types(documents=List[Document], links=List[str])
+    def run(self, query: str):
+        cache_key = _normalize_query(query)
+        cached = _SEARCH_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        result = self.search.run(query=query)
+        _SEARCH_CACHE.set(cache_key, result)
+        return result
+
 
 # Custom Component to manage source URLs
 @component
 class DocumentFormatter:
     """
-    Takes a list of Documents and returns two lists of strings:
-      - `sources`:  ["Source 1: <url1>", "Source 2: <url2>", …]
-      - `information`: ["Information 1: <content1>", …]
+    Takes a list of Documents and returns them as one structured list:
+      - `docs`: [{"url": <url1>, "content": <content1>}, …]
     """
-    @component.output_types(sources=List[str], information=List[str])
+    @component.output_types(docs=List[dict])
     def run(self, documents: List[Document]):
-        sources: List[str] = []
-        information: List[str] = []
-        for idx, doc in enumerate(documents, start=1):
-            url = doc.meta.get("url", "<no-url>")
-            sources.append(f"Source {idx}: {url}")
-            information.append(f"Information {idx}: {doc.content}")
-        return {"sources": sources, "information": information}
+        return {
+            "docs": [
+                {"url": doc.meta.get("url", "<no-url>"), "content": doc.content}
+                for doc in documents
+            ]
+        }
     
 
 # Search Pipeline
-search_pipe = Pipeline()
+def _build_search_pipeline(pipe):
+    """Add and wire the search components on a Pipeline or AsyncPipeline"""
+    pipe.add_component("search", CachedDuckduckgo(top_k=5, backend="auto"))
+    pipe.add_component("fetcher", AsyncLinkContentFetcher(timeout=3, retry_attempts=2))
+    # Search results are HTML pages, so skip MultiFileConverter's MIME routing
+    pipe.add_component("converter", HTMLToDocument())
+    pipe.add_component("formatter", DocumentFormatter())
+
+    pipe.connect("search.links", "fetcher.urls")
+    pipe.connect("fetcher.streams", "converter.sources")
+    pipe.connect("converter.documents", "formatter.documents")
+    return pipe
+
+
+# Sync pipeline for the citation Agent's ComponentTool, async pipeline for
+# callers that already run on an event loop
+search_pipe = _build_search_pipeline(Pipeline())
+async_search_pipe = _build_search_pipeline(AsyncPipeline())
+
+# Standalone components for search_batch, which drives the steps itself so
+# links shared between queries are only fetched and converted once
+_batch_search = CachedDuckduckgo(top_k=5, backend="auto")
+_batch_fetcher = AsyncLinkContentFetcher(timeout=3, retry_attempts=2)
+_batch_converter = HTMLToDocument()
+_batch_formatter = DocumentFormatter()
+
+
+async def search_batch(queries: List[str]) -> Dict[str, List[dict]]:
+    """
+    Search the web for several queries at once.
+
+    Args:
+        queries: The search query strings
+
+    Returns:
+        Dict mapping each query to its 'docs' list of {"url", "content"} items
+    """
+    queries = list(dict.fromkeys(queries))
+    searches = await asyncio.gather(
+        *(asyncio.to_thread(_batch_search.run, query=query) for query in queries),
+        return_exceptions=True,
+    )
+    links_per_query = [
+        [] if isinstance(result, BaseException) else result["links"] for result in searches
+    ]
+
+    unique_links = list(dict.fromkeys(link for links in links_per_query for link in links))
+    streams = (await _batch_fetcher.run_async(urls=unique_links))["streams"]
+    documents = (await asyncio.to_thread(_batch_converter.run, sources=streams))["documents"]
+    docs_by_url = {doc["url"]: doc for doc in _batch_formatter.run(documents=documents)["docs"]}
 
-search_pipe.add_component("search", DuckduckgoApiWebSearch(top_k=5, backend="auto"))
-search_pipe.add_component("fetcher", LinkContentFetcher(timeout=3, raise_on_failure=False, retry_attempts=2))
-search_pipe.add_component("converter", MultiFileConverter())
-search_pipe.add_component("formatter", DocumentFormatter())
+    return {
+        query: [docs_by_url[link] for link in links if link in docs_by_url]
+        for query, links in zip(queries, links_per_query)
+    }
 
-search_pipe.connect("search.links", "fetcher.urls")
-search_pipe.connect("fetcher.streams", "converter.sources")
-search_pipe.connect("converter.documents", "formatter.documents")
 
 # MCP compliant wrapper function
-def search_tool(query: str) -> dict:
+async def search_tool(query: str) -> dict:
     """
-    Perform a web search for the given query and return sources and information.
+    Perform a web search for the given query and return the fetched documents.
     
     Args:
         query: The search query string
         
     Returns:
-        Dict containing 'sources' and 'information' lists
+        Dict containing a 'docs' list of {"url", "content"} items
     """
     try:
-        # Run the search pipeline
-        result = search_pipe.run({"search": {"query": query}})
+        # Fetches are awaited on the event loop; the blocking search and HTML
+        # conversion steps are run in worker threads by AsyncPipeline
+        result = await async_search_pipe.run_async({"search": {"query": query}})
         
         return {
-            "sources": result.get("formatter", {}).get("sources", []),
-            "information": result.get("formatter", {}).get("information", []),
+            "docs": result.get("formatter", {}).get("docs", []),
             "status": "success"
         }
     except Exception as e:
         return {
-            "sources": [],
-            "information": [],
+            "docs": [],
             "status": "error",
             "error": str(e)
         }
 
 # Set function metadata for FastMCP
 search_tool.__name__ = "search_tool"
-search_tool.__doc__ = "Perform a web search and return sources and information lists"
\ No newline at end of file
+search_tool.__doc__ = "Perform a web search and return the fetched documents with their URLs"
\ No newline at end of file
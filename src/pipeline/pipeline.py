@@ -1,24 +1,27 @@
+import asyncio
 import logging
-import json
+import orjson
+from dataclasses import dataclass
 from datetime import datetime
-from pydantic import ValidationError
-from typing import List, Any
+from pydantic import BaseModel, ValidationError
+from typing import Callable, Dict, List, Any, NamedTuple, Optional, Tuple, Type
 
 # Import Pydantic models
 from src.utils.models import (
     CompanyResponse,
+    IndustryOpportunity,
     IndustryAnalysisResponse,
     MarketDataResponse,
-    CompanyResearchRequest,
     CompetitiveLandscapeResponse,
     MarketGapAnalysisResponse,
     OpportunityResponse,
     ReportSynthesisResponse,
-    MarketDataRequest,
     MarketGapAnalysisRequest,
     ReportSynthesisRequest,
 )
 
+from src.utils.cache import TTLCache, make_key
+
 # Import agent runners
 from src.agents.company_research_agent import run_company_research_agent
 from src.agents.industry_analysis_agent import run_industry_analysis_agent
@@ -28,52 +31,66 @@ from src.agents.market_gap_agent import run_market_gap_analysis_agent
 from src.agents.opportunity_agent import run_opportunity_agent
 from src.agents.report_synthesis_agent import run_report_synthesis_agent
 
-# Logging setup
+# Logging setup (handlers and level are left to the application)
 LOG_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-logging.basicConfig(level=logging.DEBUG, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
 
 def _pretty(obj: Any) -> str:
     """Safely JSON stringify for logging"""
     try:
-        return json.dumps(obj, indent=2, default=str)
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2).decode()
     except Exception:
         return str(obj)
 
 
-def safe_run(agent_fn, input_data, response_model, step_name: str):
-    """Executes agent, validates with Pydantic response model, and returns `.data`"""
+@dataclass(slots=True)
+class StepResult:
+    """Outcome of a single pipeline step"""
+    ok: bool
+    data: Any = None
+    error: Optional[str] = None
+
+
+async def safe_run(agent_fn, input_data, response_model, step_name: str) -> StepResult:
+    """Executes agent off the event loop, validates with Pydantic response model, and wraps `.data` in a StepResult"""
     try:
         logger.info("=== [%s] BEGIN ===", step_name)
-        logger.debug("[%s] INPUT:\n%s", step_name, _pretty(
-            input_data.model_dump() if hasattr(input_data, "model_dump") else input_data
-        ))
-        raw_output = agent_fn(input_data)
-        logger.debug("[%s] RAW OUTPUT:\n%s", step_name, _pretty(raw_output))
-    except Exception:
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("[%s] INPUT:\n%s", step_name, _pretty(
+                input_data.model_dump() if hasattr(input_data, "model_dump") else input_data
+            ))
+        # Agents are blocking LLM/web calls, so run them in a worker thread
+        raw_output = await asyncio.to_thread(agent_fn, input_data)
+        if debug:
+            logger.debug("[%s] RAW OUTPUT:\n%s", step_name, _pretty(raw_output))
+    except Exception as e:
         logger.exception("[%s] Agent raised exception", step_name)
-        return None
+        return StepResult(ok=False, error=str(e))
 
     try:
         if isinstance(raw_output, response_model):
             validated = raw_output
         else:
             validated = response_model(**(raw_output or {}))
-        logger.debug("[%s] VALIDATED:\n%s", step_name, _pretty(validated.model_dump()))
+        if debug:
+            logger.debug("[%s] VALIDATED:\n%s", step_name, _pretty(validated.model_dump()))
     except ValidationError as ve:
         logger.error("[%s] ValidationError:\n%s", step_name, ve)
-        return None
-    except Exception:
+        return StepResult(ok=False, error=str(ve))
+    except Exception as e:
         logger.exception("[%s] Unexpected validation error", step_name)
-        return None
+        return StepResult(ok=False, error=str(e))
 
-    if not validated.success or validated.data is None:
-        logger.error("[%s] FAILED | Reason: %s", step_name, getattr(validated, "error", "Unknown"))
-        return None
+    # Empty results (e.g. no industry opportunities) cannot feed later steps
+    if not validated.success or not validated.data:
+        reason = getattr(validated, "error", None) or "Unknown"
+        logger.error("[%s] FAILED | Reason: %s", step_name, reason)
+        return StepResult(ok=False, error=reason)
 
     logger.info("=== [%s] END (ok) ===", step_name)
-    return validated.data
+    return StepResult(ok=True, data=validated.data)
 
 
 def select_domain_from_user(domains: List[str]) -> str:
@@ -90,87 +107,168 @@ def select_domain_from_user(domains: List[str]) -> str:
     return next((d for d in domains if d.lower() == choice.lower()), domains[0])
 
 
-def run_pipeline(company_name: str) -> ReportSynthesisResponse:
-    logger.info(f"=== PIPELINE START for {company_name} ===")
-
-    # 1. Company Research
-    company_data = safe_run(
-        run_company_research_agent,
-        CompanyResearchRequest(company_name=company_name),
-        CompanyResponse,
-        "CompanyResearch"
-    )
-    if not company_data:
-        return ReportSynthesisResponse(success=False, error="Company research failed.")
-
-    # 2. Industry Analysis
-    industry_data = safe_run(
-        run_industry_analysis_agent,
-        company_data,
-        IndustryAnalysisResponse,
-        "IndustryAnalysis"
-    )
-    if not industry_data:
-        return ReportSynthesisResponse(success=False, error="Industry analysis failed.")
-
-    # 3. Domain selection
-    domain = select_domain_from_user([op.domain for op in industry_data])
-    logger.info(f"Domain selected: {domain}")
-
-    # 4. Market Data
-    market_data = safe_run(
-        run_market_data_agent,
-        MarketDataRequest(domain=domain),
-        MarketDataResponse,
-        "MarketData"
-    )
-    if not market_data:
-        return ReportSynthesisResponse(success=False, error="Market data failed.")
-
-    # 5. Competitive Landscape
-    competitive_data = safe_run(
-        run_competitive_landscape_agent,
-        {"domain": domain},  # 🔹 fix if your agent expects request model
-        CompetitiveLandscapeResponse,
-        "CompetitiveLandscape"
-    )
-    if not competitive_data:
-        return ReportSynthesisResponse(success=False, error="Competitive landscape failed.")
-
-    # 6. Market Gap Analysis
-    gap_analysis = safe_run(
-        run_market_gap_analysis_agent,
-        MarketGapAnalysisRequest(
-            company_profile=company_data,
-            competitor_list=competitive_data,
-            market_stats=market_data
+class PipelineStep(NamedTuple):
+    """A single agent invocation in the linear pipeline"""
+    name: str
+    agent_fn: Callable[[Any], Any]
+    build_input: Callable[[Dict[str, Any]], Any]
+    response_model: Type[BaseModel]
+    output_key: str
+    error: str
+
+
+# Steps are grouped into stages; steps within a stage only depend on earlier
+# stages and run concurrently. Domain selection happens between the two halves.
+RESEARCH_STAGES: List[Tuple[PipelineStep, ...]] = [
+    (PipelineStep(
+        "CompanyResearch", run_company_research_agent,
+        lambda ctx: ctx["company_name"],
+        CompanyResponse, "company_data", "Company research failed."
+    ),),
+    (PipelineStep(
+        "IndustryAnalysis", run_industry_analysis_agent,
+        lambda ctx: ctx["company_data"].model_dump(),
+        IndustryAnalysisResponse, "industry_data", "Industry analysis failed."
+    ),),
+]
+
+DOMAIN_STAGES: List[Tuple[PipelineStep, ...]] = [
+    (
+        PipelineStep(
+            "MarketData", run_market_data_agent,
+            lambda ctx: ctx["domain"],
+            MarketDataResponse, "market_data", "Market data failed."
         ),
-        MarketGapAnalysisResponse,
-        "GapAnalysis"
-    )
-    if not gap_analysis:
-        return ReportSynthesisResponse(success=False, error="Gap analysis failed.")
-
-    # 7. Opportunity Analysis
-    opportunities = safe_run(
-        run_opportunity_agent,
-        gap_analysis,
-        OpportunityResponse,
-        "OpportunityAnalysis"
+        PipelineStep(
+            "CompetitiveLandscape", run_competitive_landscape_agent,
+            lambda ctx: ctx["opportunity"].model_dump(),
+            CompetitiveLandscapeResponse, "competitive_data", "Competitive landscape failed."
+        ),
+    ),
+    (PipelineStep(
+        "GapAnalysis", run_market_gap_analysis_agent,
+        lambda ctx: MarketGapAnalysisRequest(
+            company_profile=ctx["company_data"],
+            competitor_list=ctx["competitive_data"],
+            market_stats=ctx["market_data"]
+        ).model_dump(),
+        MarketGapAnalysisResponse, "gap_analysis", "Gap analysis failed."
+    ),),
+    (PipelineStep(
+        "OpportunityAnalysis", run_opportunity_agent,
+        lambda ctx: [gap.model_dump() for gap in ctx["gap_analysis"]],
+        OpportunityResponse, "opportunities", "Opportunity analysis failed."
+    ),),
+]
+
+
+async def _run_stages(
+    stages: List[Tuple[PipelineStep, ...]],
+    ctx: Dict[str, Any],
+    notify: Callable[[str], None],
+) -> Optional[str]:
+    """Run each stage in order, storing outputs in `ctx`. Returns the first error (step message plus its reason), if any."""
+    for stage in stages:
+        notify(" + ".join(step.name for step in stage))
+        outputs = await asyncio.gather(*(
+            safe_run(step.agent_fn, step.build_input(ctx), step.response_model, step.name)
+            for step in stage
+        ))
+        for step, output in zip(stage, outputs):
+            if not output.ok:
+                # Keep the step's own reason so callers see why it failed
+                return f"{step.error} {output.error}" if output.error else step.error
+            ctx[step.output_key] = output.data
+    return None
+
+
+# Company research + industry analysis outputs per company, so running the
+# pipeline again for another domain of the same company skips both LLM steps.
+# Entries expire after six hours so company profiles do not go stale in a
+# long-running API process
+_RESEARCH_CACHE = TTLCache(maxsize=128, ttl=6 * 3600)
+
+
+async def _run_research(ctx: Dict[str, Any], notify: Callable[[str], None]) -> Optional[str]:
+    """Run (or reuse cached) research stages for `ctx["company_name"]`. Returns the first error, if any."""
+    cache_key = make_key(ctx["company_name"].strip().lower())
+    cached = _RESEARCH_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("Reusing cached research for %s", ctx["company_name"])
+        ctx.update(cached)
+        return None
+
+    error = await _run_stages(RESEARCH_STAGES, ctx, notify)
+    if error is None:
+        _RESEARCH_CACHE.set(cache_key, {
+            step.output_key: ctx[step.output_key]
+            for stage in RESEARCH_STAGES for step in stage
+        })
+    return error
+
+
+async def run_linear_pipeline(
+    company_name: str,
+    selected_domain: Optional[str] = None,
+    domain_selector: Optional[Callable[[List[str]], str]] = None,
+    progress_cb: Optional[Callable[[str], None]] = None,
+) -> ReportSynthesisResponse:
+    """
+    Run every agent for a company and synthesize the final report.
+
+    Market data and competitive landscape only depend on the selected domain,
+    so they run concurrently once the domain is known.
+
+    Args:
+        company_name: Company to research
+        selected_domain: Domain to analyze; skips domain selection when given
+        domain_selector: Callback choosing a domain from the industry analysis
+            results. Defaults to the first (highest ranked) domain.
+        progress_cb: Called with the step name before each step starts
+
+    Returns:
+        ReportSynthesisResponse with the generated report or the failing step
+    """
+    logger.info("=== PIPELINE START for %s ===", company_name)
+    notify = progress_cb or (lambda step_name: None)
+    ctx: Dict[str, Any] = {"company_name": company_name}
+
+    error = await _run_research(ctx, notify)
+    if error:
+        return ReportSynthesisResponse(success=False, error=error)
+
+    # Domain selection
+    industry_data = ctx["industry_data"]
+    domains = [op.domain for op in industry_data]
+    if selected_domain:
+        domain = selected_domain
+    elif domain_selector:
+        domain = domain_selector(domains)
+    else:
+        domain = domains[0]
+    logger.info("Domain selected: %s", domain)
+    ctx["domain"] = domain
+    ctx["opportunity"] = next(
+        (op for op in industry_data if op.domain == domain),
+        IndustryOpportunity(domain=domain, score=0.0, rationale="", sources=[])
     )
-    if not opportunities:
-        return ReportSynthesisResponse(success=False, error="Opportunity analysis failed.")
 
-    # 8. Report Synthesis
-    report_resp = run_report_synthesis_agent(
+    error = await _run_stages(DOMAIN_STAGES, ctx, notify)
+    if error:
+        return ReportSynthesisResponse(success=False, error=error)
+
+    # Report Synthesis
+    notify("ReportSynthesis")
+    report_resp = await asyncio.to_thread(
+        run_report_synthesis_agent,
         ReportSynthesisRequest(
-            company_research_data=company_data,
+            company_research_data=ctx["company_data"],
             domain_research_data=industry_data,
-            market_research_data=market_data,
-            competitive_research_data=competitive_data,
-            gap_analysis_data=gap_analysis,
-            opportunity_research_data=opportunities,
-        )
+            market_research_data=ctx["market_data"],
+            competitive_research_data=ctx["competitive_data"],
+            gap_analysis_data=ctx["gap_analysis"],
+            opportunity_research_data=ctx["opportunities"],
+        ).model_dump()
     )
 
     # Ensure correct response type
@@ -183,7 +281,15 @@ def run_pipeline(company_name: str) -> ReportSynthesisResponse:
         return ReportSynthesisResponse(success=False, error="Report synthesis validation failed.")
 
 
+def run_pipeline(company_name: str) -> ReportSynthesisResponse:
+    """Run the pipeline interactively, prompting for the domain to analyze"""
+    return asyncio.run(
+        run_linear_pipeline(company_name, domain_selector=select_domain_from_user)
+    )
+
+
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format=LOG_FORMAT)
     result = run_pipeline("OpenAI")
     print("\n=== PIPELINE RESULT ===")
     print(result.model_dump())
@@ -1,12 +1,32 @@
-from .validation import (
-    CompanyValidator, IndustryAnalysisValidator, MarketDataValidator,
-    CompetitiveLandscapeValidator, MarketGapAnalysisValidator,
-    OpportunityValidator, ReportSynthesisValidator
-)
-from .mcp_manager import MCPServerManager
-
-__all__ = [
-    "CompanyValidator", "IndustryAnalysisValidator", "MarketDataValidator",
-    "CompetitiveLandscapeValidator", "MarketGapAnalysisValidator",
-    "OpportunityValidator", "ReportSynthesisValidator", "MCPServerManager"
-]
+import importlib
+
+# Imported on first attribute access (PEP 562) so lightweight helpers such as
+# src.utils.cache do not pull in pydantic and the MCP manager
+_EXPORTS = {
+    "ValidationResult": ".validation",
+    "CompanyValidator": ".validation",
+    "IndustryAnalysisValidator": ".validation",
+    "MarketDataValidator": ".validation",
+    "CompetitiveLandscapeValidator": ".validation",
+    "MarketGapAnalysisValidator": ".validation",
+    "OpportunityValidator": ".validation",
+    "ReportSynthesisValidator": ".validation",
+    "COMPANY_VALIDATOR": ".validation",
+    "INDUSTRY_ANALYSIS_VALIDATOR": ".validation",
+    "MARKET_DATA_VALIDATOR": ".validation",
+    "COMPETITIVE_LANDSCAPE_VALIDATOR": ".validation",
+    "MARKET_GAP_ANALYSIS_VALIDATOR": ".validation",
+    "OPPORTUNITY_VALIDATOR": ".validation",
+    "REPORT_SYNTHESIS_VALIDATOR": ".validation",
+    "MCPServerManager": ".mcp_manager"
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,9 +1,14 @@
 from typing import List, Optional, Dict, Any
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
+
+
+class FrozenModel(BaseModel):
+    """Immutable model for agent data and requests, which are never modified after validation"""
+    model_config = ConfigDict(frozen=True)
 
 
 # Base Models
-class Company(BaseModel):
+class Company(FrozenModel):
     name: str
     industry: str
     description: str
@@ -12,14 +17,14 @@ class Company(BaseModel):
     sources: List[str]
 
 
-class IndustryOpportunity(BaseModel):
+class IndustryOpportunity(FrozenModel):
     domain: str
     score: float
     rationale: str
     sources: List[str]
 
 
-class CompetitiveLandscape(BaseModel):
+class CompetitiveLandscape(FrozenModel):
     competitor: str
     product: str
     market_share: float
@@ -27,21 +32,21 @@ class CompetitiveLandscape(BaseModel):
     sources: List[str]
 
 
-class MarketData(BaseModel):
+class MarketData(FrozenModel):
     market_size_usd: float
     CAGR: float
     key_drivers: List[str]
     sources: List[str]
 
 
-class MarketGap(BaseModel):
+class MarketGap(FrozenModel):
     gap: str
     impact: str
     evidence: str
     source: List[str]
 
 
-class Opportunity(BaseModel):
+class Opportunity(FrozenModel):
     title: str
     priority: str  
     description: str
@@ -58,20 +63,20 @@ class PipelineConfig(BaseModel):
 
 
 # Request Models
-class MarketDataRequest(BaseModel):
+class MarketDataRequest(FrozenModel):
     domain: str
 
 
-class MarketGapAnalysisRequest(BaseModel):
+class MarketGapAnalysisRequest(FrozenModel):
     company_profile: Company
     competitor_list: List[CompetitiveLandscape]
     market_stats: MarketData
 
 
-class CompanyResearchRequest(BaseModel):
+class CompanyResearchRequest(FrozenModel):
     company_name: str
 
-class ReportSynthesisRequest(BaseModel):
+class ReportSynthesisRequest(FrozenModel):
     company_research_data: Company
     domain_research_data: List[IndustryOpportunity]
     market_research_data: MarketData
@@ -1,6 +1,8 @@
-from typing import Optional, List, Dict, Any, Type
-from pydantic import BaseModel, ValidationError
-import json
+import copy
+import functools
+from typing import Callable, Optional, List, Dict, Any, NamedTuple, Type, Union, get_args
+from pydantic import BaseModel, TypeAdapter, ValidationError
+import orjson
 
 from src.utils.models import (
     Company, IndustryOpportunity, CompetitiveLandscape, 
@@ -9,46 +11,144 @@ from src.utils.models import (
 )
 
 
+def _contains_model(annotation: Any) -> bool:
+    """Whether a field annotation is, or wraps, a pydantic model"""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return True
+    return any(_contains_model(arg) for arg in get_args(annotation))
+
+
+def _is_flat(model: Type[BaseModel]) -> bool:
+    """Whether the model has no nested models, computed fields or extra fields"""
+    return (
+        not model.model_computed_fields
+        and model.model_config.get("extra") != "allow"
+        and not any(_contains_model(field.annotation) for field in model.model_fields.values())
+    )
+
+
+def _copy_fields(instance: BaseModel) -> Dict[str, Any]:
+    """
+    Plain-dict dump of a flat model instance. Lists are copied, as pydantic's
+    dump does, so changing the dict never reaches the (frozen) instance.
+    """
+    return {name: list(value) if type(value) is list else value for name, value in instance.__dict__.items()}
+
+
+class ValidationResult(NamedTuple):
+    """
+    Outcome of a validation call. A tuple rather than a dict, so building one
+    costs no hashing; `result["valid"]` / `result.get("error")` still work
+    for dict-style callers and `to_dict()` gives the legacy dict.
+    """
+    valid: bool
+    data: Any = None
+    error: Optional[str] = None
+    error_details: Optional[List[Dict[str, Any]]] = None
+
+    def __getitem__(self, key):
+        if type(key) is str:
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict.get-style access by field name"""
+        return getattr(self, key, default) if key in self._fields else default
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The result as the dict validators used to return"""
+        result = {"valid": self.valid, "data": self.data, "error": self.error}
+        if self.error_details is not None:
+            result["error_details"] = self.error_details
+        return result
+
+
+def _validation_result(parses_json: bool = False):
+    """
+    Wrap a validator method that returns validated data in a ValidationResult,
+    turning validation failures into invalid results. `error_details` is only
+    built when the validator's include_details is set.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs) -> ValidationResult:
+            try:
+                return ValidationResult(True, func(self, *args, **kwargs))
+            except ValidationError as e:
+                if parses_json and e.errors(include_url=False)[0]["type"] == "json_invalid":
+                    return ValidationResult(False, error=f"Invalid JSON format: {str(e)}")
+                return ValidationResult(
+                    False,
+                    error=str(e),
+                    error_details=e.errors() if self.include_details else None
+                )
+            except Exception as e:
+                return ValidationResult(False, error=f"Unexpected validation error: {str(e)}")
+        return wrapper
+    return decorator
+
+
 class BaseValidator:
     """Base validator class with common validation methods"""
     
-    def __init__(self, model: Type[BaseModel]):
+    __slots__ = ("model", "include_details", "schema", "_validate", "_validate_json", "_dump")
+    
+    def __init__(self, model: Type[BaseModel], include_details: bool = True):
         self.model = model
+        # Whether failures carry the per-error `error_details` list
+        self.include_details = include_details
+        # Built once here so schema endpoints do not regenerate it per request
+        self.schema = model.model_json_schema()
+        # Bound pydantic-core entry points, skipping the BaseModel wrappers
+        self._validate = model.__pydantic_validator__.validate_python
+        self._validate_json = model.__pydantic_validator__.validate_json
+        # Flat models dump to exactly their field dict, so copy that instead of
+        # walking the serializer; nested models need the full dump
+        self._dump = _copy_fields if _is_flat(model) else model.__pydantic_serializer__.to_python
     
-    def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    @_validation_result()
+    def validate(self, data: Union[Dict[str, Any], BaseModel]) -> ValidationResult:
         """
         Validate data against the model schema.
         
         Args:
-            data: Dictionary containing data to validate
+            data: Dictionary containing data to validate, or an instance of
+                the model (frozen, so already valid and not re-validated)
             
         Returns:
-            Dict with validation results
+            ValidationResult with the validated data
         """
-        try:
-            validated_data = self.model.model_validate(data)
-            
-            return {
-                "valid": True,
-                "data": validated_data.model_dump(),
-                "error": None
-            }
+        validated_data = data if isinstance(data, self.model) else self._validate(data)
+        return self._dump(validated_data)
+    
+    @_validation_result()
+    def validate_and_dumps(self, data: Union[Dict[str, Any], BaseModel]) -> ValidationResult:
+        """
+        Validate data and serialize it straight to JSON bytes with orjson.
+        
+        Args:
+            data: Dictionary containing data to validate, or a model instance
             
-        except ValidationError as e:
-            return {
-                "valid": False,
-                "data": None,
-                "error": str(e),
-                "error_details": e.errors()
-            }
-        except Exception as e:
-            return {
-                "valid": False,
-                "data": None,
-                "error": f"Unexpected validation error: {str(e)}"
-            }
+        Returns:
+            ValidationResult with the UTF-8 encoded JSON of the validated data
+        """
+        validated_data = data if isinstance(data, self.model) else self._validate(data)
+        return orjson.dumps(self._dump(validated_data))
+    
+    def validate_trusted(self, data: Dict[str, Any]) -> ValidationResult:
+        """
+        Accept data that was already validated against this model upstream
+        (e.g. a FastAPI request body dumped with model_dump()) without
+        running the validator again.
+
+        Never use this for data from LLM outputs or other untrusted sources.
+        """
+        return ValidationResult(True, data)
     
-    def validate_json_string(self, json_string: str) -> Dict[str, Any]:
+    @_validation_result(parses_json=True)
+    def validate_json_string(self, json_string: str) -> ValidationResult:
         """
         Validate a JSON string.
         
@@ -56,30 +156,32 @@ class BaseValidator:
             json_string: JSON string to validate
             
         Returns:
-            Dict with validation results
+            ValidationResult with the validated data
         """
-        try:
-            data = json.loads(json_string)
-            return self.validate(data)
-        except json.JSONDecodeError as e:
-            return {
-                "valid": False,
-                "data": None,
-                "error": f"Invalid JSON format: {str(e)}"
-            }
+        # Parse and validate in one pass, straight from the JSON text
+        return self._dump(self._validate_json(json_string))
     
     def get_schema(self) -> Dict[str, Any]:
-        """Get the JSON schema for the model"""
-        return self.model.model_json_schema()
+        """Get the JSON schema for the model (a copy, so callers cannot alter the cached one)"""
+        return copy.deepcopy(self.schema)
 
 
 class ListValidator:
     """Base validator for list-based outputs"""
     
-    def __init__(self, item_model: Type[BaseModel]):
+    __slots__ = ("item_model", "include_details", "list_adapter", "schema")
+    
+    def __init__(self, item_model: Type[BaseModel], include_details: bool = True):
         self.item_model = item_model
+        self.include_details = include_details
+        # Validates the whole list in one pydantic-core call
+        self.list_adapter = TypeAdapter(List[item_model])
+        self.schema = {
+            "type": "array",
+            "items": item_model.model_json_schema()
+        }
     
-    def validate_output(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def validate_output(self, data: List[Dict[str, Any]]) -> ValidationResult:
         """
         Validate list output against the expected schema.
         
@@ -87,53 +189,105 @@ class ListValidator:
             data: List of items to validate
             
         Returns:
-            Dict with validation results
+            ValidationResult with the validated data
         """
-        try:
-            if not isinstance(data, list):
-                return {
-                    "valid": False,
-                    "data": None,
-                    "error": f"Expected list but got {type(data).__name__}"
-                }
-                
-            validated_items = [self.item_model.model_validate(item) for item in data]
-            
-            return {
-                "valid": True,
-                "data": [item.model_dump() for item in validated_items],
-                "error": None
-            }
+        if type(data) is not list:
+            return ValidationResult(False, error=f"Expected list but got {type(data).__name__}")
+        return self._validate_list(data)
+    
+    @_validation_result()
+    def _validate_list(self, data: List[Any]) -> ValidationResult:
+        # Model instances are frozen, so ones built upstream are still valid
+        if data and all(isinstance(item, self.item_model) for item in data):
+            return self.list_adapter.dump_python(data)
+        return self.list_adapter.dump_python(self.list_adapter.validate_python(data))
+    
+    @_validation_result(parses_json=True)
+    def validate_output_json(self, raw: Union[str, bytes]) -> ValidationResult:
+        """
+        Validate a raw JSON array (e.g. an HTTP body or LLM reply) against the
+        expected schema, parsing and validating it in one pass.
+        
+        Args:
+            raw: JSON text or bytes of the list to validate
             
-        except ValidationError as e:
-            return {
-                "valid": False,
-                "data": None,
-                "error": str(e),
-                "error_details": e.errors()
-            }
-        except Exception as e:
-            return {
-                "valid": False,
-                "data": None,
-                "error": f"Unexpected validation error: {str(e)}"
-            }
+        Returns:
+            ValidationResult with the validated data
+        """
+        return self.list_adapter.dump_python(self.list_adapter.validate_json(raw))
+    
+    def validate_trusted(self, data: List[Dict[str, Any]]) -> ValidationResult:
+        """
+        Accept a list that was already validated against the item model
+        upstream without running the validator again.
+
+        Never use this for data from LLM outputs or other untrusted sources.
+        """
+        return ValidationResult(True, data)
     
     def get_output_schema(self) -> Dict[str, Any]:
-        """Get the JSON schema for the output list"""
-        return {
-            "type": "array",
-            "items": self.item_model.model_json_schema()
-        }
+        """Get the JSON schema for the output list (a copy, so callers cannot alter the cached one)"""
+        return copy.deepcopy(self.schema)
+
+
+# Field types the generated fast validators know how to check exactly
+_FAST_CHECKS = {
+    str: "type({v}) is str",
+    float: "type({v}) is float",
+    List[str]: "type({v}) is list and all(type(x) is str for x in {v})",
+}
+
+
+def _make_fast_validator(model: Type[BaseModel]) -> Optional[Callable[[Any], Optional[Dict[str, Any]]]]:
+    """
+    Generate a function specialised to `model` that returns the dumped dict
+    when every field is present with exactly its annotated type, and None
+    for anything else so the caller can fall back to full validation.
+    Returns None if the model has a field it cannot check.
+    """
+    fields = model.model_fields
+    if not _is_flat(model) or any(
+        not field.is_required() or field.annotation not in _FAST_CHECKS
+        for field in fields.values()
+    ):
+        return None
+
+    lines = [f"def _fast_{model.__name__}(d):", "    if type(d) is not dict:", "        return None"]
+    values = []
+    for i, (name, field) in enumerate(fields.items()):
+        var = f"v{i}"
+        lines.append(f"    {var} = d.get({name!r})")
+        lines.append(f"    if not ({_FAST_CHECKS[field.annotation].format(v=var)}):")
+        lines.append("        return None")
+        value_expr = f"list({var})" if field.annotation == List[str] else var
+        values.append(f"{name!r}: {value_expr}")
+    lines.append(f"    return {{{', '.join(values)}}}")
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace[f"_fast_{model.__name__}"]
 
 
 class CompanyValidator(BaseValidator):
     """Validator for Company Research Agent output"""
     
-    def __init__(self):
-        super().__init__(Company)
+    __slots__ = ()
+    
+    # Company is validated at the start of every pipeline run, so well-formed
+    # dicts skip pydantic entirely; anything else takes the full path
+    _fast_validate = staticmethod(_make_fast_validator(Company))
     
-    def validate_output(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def __init__(self, include_details: bool = True):
+        super().__init__(Company, include_details)
+    
+    def validate(self, data: Union[Dict[str, Any], BaseModel]) -> ValidationResult:
+        """Validate company data, using the generated fast path when it applies"""
+        fast_data = self._fast_validate(data) if self._fast_validate is not None else None
+        if fast_data is not None:
+            return ValidationResult(True, fast_data)
+        return super().validate(data)
+    
+    def validate_output(self, data: Dict[str, Any]) -> ValidationResult:
         """Validate company research output"""
         return self.validate(data)
 
@@ -141,15 +295,19 @@ class CompanyValidator(BaseValidator):
 class IndustryAnalysisValidator:
     """Validator for Industry Analysis Agent input and output"""
     
-    def __init__(self):
-        self.input_validator = BaseValidator(Company)
-        self.output_validator = ListValidator(IndustryOpportunity)
+    __slots__ = ("input_validator", "output_validator")
+    
+    def __init__(self, include_details: bool = True):
+        self.input_validator = BaseValidator(Company, include_details)
+        self.output_validator = ListValidator(IndustryOpportunity, include_details)
         
-    def validate_input(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate input company data"""
+    def validate_input(self, data: Union[Dict[str, Any], Company], trusted: bool = False) -> ValidationResult:
+        """Validate input company data (a Company instance is accepted as-is); trusted=True skips re-validating already-validated data"""
+        if trusted:
+            return self.input_validator.validate_trusted(data)
         return self.input_validator.validate(data)
     
-    def validate_output(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def validate_output(self, data: List[Dict[str, Any]]) -> ValidationResult:
         """Validate industry analysis output"""
         return self.output_validator.validate_output(data)
     
@@ -165,15 +323,19 @@ class IndustryAnalysisValidator:
 class CompetitiveLandscapeValidator:
     """Validator for Competitive Landscape Agent input and output"""
     
-    def __init__(self):
-        self.input_validator = BaseValidator(IndustryOpportunity)
-        self.output_validator = ListValidator(CompetitiveLandscape)
+    __slots__ = ("input_validator", "output_validator")
+    
+    def __init__(self, include_details: bool = True):
+        self.input_validator = BaseValidator(IndustryOpportunity, include_details)
+        self.output_validator = ListValidator(CompetitiveLandscape, include_details)
         
-    def validate_input(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate input industry opportunity data"""
+    def validate_input(self, data: Dict[str, Any], trusted: bool = False) -> ValidationResult:
+        """Validate input industry opportunity data; trusted=True skips re-validating already-validated data"""
+        if trusted:
+            return self.input_validator.validate_trusted(data)
         return self.input_validator.validate(data)
     
-    def validate_output(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def validate_output(self, data: List[Dict[str, Any]]) -> ValidationResult:
         """Validate competitive landscape output"""
         return self.output_validator.validate_output(data)
     
@@ -189,15 +351,19 @@ class CompetitiveLandscapeValidator:
 class MarketGapAnalysisValidator:
     """Validator for Market Gap Analysis Agent input and output"""
     
-    def __init__(self):
-        self.input_validator = BaseValidator(MarketGapAnalysisRequest)
-        self.output_validator = ListValidator(MarketGap)
+    __slots__ = ("input_validator", "output_validator")
+    
+    def __init__(self, include_details: bool = True):
+        self.input_validator = BaseValidator(MarketGapAnalysisRequest, include_details)
+        self.output_validator = ListValidator(MarketGap, include_details)
         
-    def validate_input(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate market gap analysis input model."""
+    def validate_input(self, data: Dict[str, Any], trusted: bool = False) -> ValidationResult:
+        """Validate market gap analysis input model; trusted=True skips re-validating already-validated data."""
+        if trusted:
+            return self.input_validator.validate_trusted(data)
         return self.input_validator.validate(data)
     
-    def validate_output(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def validate_output(self, data: List[Dict[str, Any]]) -> ValidationResult:
         """Validate market gap analysis output"""
         return self.output_validator.validate_output(data)
     
@@ -212,40 +378,46 @@ class MarketGapAnalysisValidator:
 
 class MarketDataValidator:
     """Validator for Market Data Agent input and output."""
+    
+    __slots__ = ("input_validator", "output_validator")
 
-    def __init__(self):
-        self.input_validator = BaseValidator(MarketDataRequest)
-        self.output_validator = BaseValidator(MarketData)
+    def __init__(self, include_details: bool = True):
+        self.input_validator = BaseValidator(MarketDataRequest, include_details)
+        self.output_validator = BaseValidator(MarketData, include_details)
 
-    def validate_input(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_input(self, data: Dict[str, Any]) -> ValidationResult:
         """Validate Market Data Agent input (domain string wrapped in dict)."""
         return self.input_validator.validate(data)
 
-    def validate_output(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_output(self, data: Dict[str, Any]) -> ValidationResult:
         """Validate Market Data Agent output (market data dictionary)."""
         return self.output_validator.validate(data)
 
     def get_input_schema(self) -> Dict[str, Any]:
         """Return input schema for market data."""
-        return MarketDataRequest.model_json_schema()
+        return self.input_validator.get_schema()
 
     def get_output_schema(self) -> Dict[str, Any]:
         """Return output schema for market data."""
-        return MarketData.model_json_schema()
+        return self.output_validator.get_schema()
 
 
 class OpportunityValidator:
     """Validator for Opportunity Agent input and output"""
+    
+    __slots__ = ("input_validator", "output_validator")
 
-    def __init__(self):
-        self.input_validator = ListValidator(MarketGap)
-        self.output_validator = ListValidator(Opportunity)
+    def __init__(self, include_details: bool = True):
+        self.input_validator = ListValidator(MarketGap, include_details)
+        self.output_validator = ListValidator(Opportunity, include_details)
 
-    def validate_input(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Validate input for Opportunity Agent (list of market gaps)"""
+    def validate_input(self, data: List[Dict[str, Any]], trusted: bool = False) -> ValidationResult:
+        """Validate input for Opportunity Agent (list of market gaps); trusted=True skips re-validating already-validated data"""
+        if trusted:
+            return self.input_validator.validate_trusted(data)
         return self.input_validator.validate_output(data)
 
-    def validate_output(self, data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def validate_output(self, data: List[Dict[str, Any]]) -> ValidationResult:
         """Validate the Opportunity Agent output"""
         return self.output_validator.validate_output(data)
 
@@ -256,75 +428,77 @@ class OpportunityValidator:
         return self.output_validator.get_output_schema()
 
 
+# Fields the report synthesis output data section must contain, in check
+# order, with their exact type and how it reads in error messages
+REPORT_FIELD_TYPES = {
+    "pdf_content": (bytes, "bytes"),
+    "report_title": (str, "a string"),
+    "generated_at": (str, "a string")
+}
+REPORT_REQUIRED_FIELDS = tuple(REPORT_FIELD_TYPES)
+
+# Schema of the report synthesis output data section, which has no model
+REPORT_OUTPUT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "pdf_content": {"type": "string", "format": "binary"},
+        "report_title": {"type": "string"},
+        "generated_at": {"type": "string", "format": "date-time"},
+        "placeholder": {"type": "boolean"}
+    },
+    "required": list(REPORT_REQUIRED_FIELDS)
+}
+
+
 class ReportSynthesisValidator:
     """Validator for Report Synthesis Agent input and output"""
     
-    def __init__(self):
-        self.input_validator = BaseValidator(ReportSynthesisRequest)
+    __slots__ = ("input_validator",)
     
-    def validate_input(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def __init__(self, include_details: bool = True):
+        self.input_validator = BaseValidator(ReportSynthesisRequest, include_details)
+    
+    def validate_input(self, data: Dict[str, Any]) -> ValidationResult:
         """Validate report synthesis agent input model"""
         return self.input_validator.validate(data)
     
-    def validate_output(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def validate_output(self, data: Dict[str, Any]) -> ValidationResult:
         """
         Validate report synthesis agent output data section
         Expects the 'data' portion of the agent response
         """
         try:
-            required_fields = ["pdf_content", "report_title", "generated_at"]
-            
-            for field in required_fields:
+            for field in REPORT_REQUIRED_FIELDS:
                 if field not in data:
-                    return {
-                        "valid": False,
-                        "error": f"Missing required field: {field}"
-                    }
+                    return ValidationResult(False, error=f"Missing required field: {field}")
             
             # Validate data types
-            if not isinstance(data.get("pdf_content"), bytes):
-                return {
-                    "valid": False,
-                    "error": "pdf_content must be bytes"
-                }
+            for field, (expected_type, type_name) in REPORT_FIELD_TYPES.items():
+                if type(data[field]) is not expected_type:
+                    return ValidationResult(False, error=f"{field} must be {type_name}")
             
-            if not isinstance(data.get("report_title"), str):
-                return {
-                    "valid": False,
-                    "error": "report_title must be a string"
-                }
-            
-            if not isinstance(data.get("generated_at"), str):
-                return {
-                    "valid": False,
-                    "error": "generated_at must be a string"
-                }
-            
-            return {
-                "valid": True,
-                "data": data
-            }
+            return ValidationResult(True, data)
             
         except Exception as e:
-            return {
-                "valid": False,
-                "error": f"Output validation error: {str(e)}"
-            }
+            return ValidationResult(False, error=f"Output validation error: {str(e)}")
     
     def get_input_schema(self) -> Dict[str, Any]:
         """Get the JSON schema for the input ReportSynthesisRequest model"""
         return self.input_validator.get_schema()
     
     def get_output_schema(self) -> Dict[str, Any]:
-        """Get the JSON schema for the output data section"""
-        return {
-            "type": "object",
-            "properties": {
-                "pdf_content": {"type": "string", "format": "binary"},
-                "report_title": {"type": "string"},
-                "generated_at": {"type": "string", "format": "date-time"},
-                "placeholder": {"type": "boolean"}
-            },
-            "required": ["pdf_content", "report_title", "generated_at"]
-        }
+        """Get the JSON schema for the output data section (a copy of the shared constant)"""
+        return copy.deepcopy(REPORT_OUTPUT_SCHEMA)
+
 
+# Shared instances. Validators hold no per-call state, so every caller can
+# reuse these instead of rebuilding adapters and schemas. Their callers (API
+# routes and the TUI) only report the `error` message, so the per-error
+# `error_details` list is not built.
+COMPANY_VALIDATOR = CompanyValidator(include_details=False)
+INDUSTRY_ANALYSIS_VALIDATOR = IndustryAnalysisValidator(include_details=False)
+MARKET_DATA_VALIDATOR = MarketDataValidator(include_details=False)
+COMPETITIVE_LANDSCAPE_VALIDATOR = CompetitiveLandscapeValidator(include_details=False)
+MARKET_GAP_ANALYSIS_VALIDATOR = MarketGapAnalysisValidator(include_details=False)
+OPPORTUNITY_VALIDATOR = OpportunityValidator(include_details=False)
+REPORT_SYNTHESIS_VALIDATOR = ReportSynthesisValidator(include_details=False)
@@ -0,0 +1,74 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("haystack")
+
+from src.mcp_server.tools import citation_agent_tool, search_tool
+from src.utils.cache import TTLCache
+
+
+def _fake_agent(reply_text):
+    def run(messages):
+        return {"replies": [SimpleNamespace(text=reply_text)]}
+    return SimpleNamespace(chat_generator=SimpleNamespace(run=run))
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(citation_agent_tool, "_CITATION_CACHE", TTLCache(maxsize=16, ttl=60))
+
+
+def test_batch_falls_back_per_claim_on_length_mismatch(monkeypatch):
+    claims = [("claim a", "ctx a"), ("claim b", "ctx b")]
+
+    async def fake_search_batch(queries):
+        return {query: [{"url": "https://example.com", "content": "x" * 5000}] for query in queries}
+
+    async def fake_citation_agent(claim, context):
+        # Same shape as the real tool: the agent's reply texts
+        return ['{"claim_valid": true, "citations": []}']
+
+    monkeypatch.setattr(search_tool, "search_batch", fake_search_batch)
+    monkeypatch.setattr(citation_agent_tool, "citation_agent", fake_citation_agent)
+    monkeypatch.setattr(
+        citation_agent_tool, "_get_agent",
+        lambda: _fake_agent('[{"claim": "claim a", "claim_valid": true, "citations": []}]'),
+    )
+
+    results = asyncio.run(citation_agent_tool.citation_agent_batch(claims))
+
+    assert all(isinstance(result, dict) for result in results)
+    assert [result["claim"] for result in results] == ["claim a", "claim b"]
+    assert all(result["claim_valid"] is True and result["citations"] == [] for result in results)
+
+
+def test_batch_reuses_cached_results(monkeypatch):
+    claims = [("claim a", "ctx a")]
+    searches = []
+
+    async def fake_search_batch(queries):
+        searches.append(queries)
+        return {query: [] for query in queries}
+
+    monkeypatch.setattr(search_tool, "search_batch", fake_search_batch)
+    monkeypatch.setattr(
+        citation_agent_tool, "_get_agent",
+        lambda: _fake_agent('[{"claim": "claim a", "claim_valid": true, "citations": []}]'),
+    )
+
+    first = asyncio.run(citation_agent_tool.citation_agent_batch(claims))
+    second = asyncio.run(citation_agent_tool.citation_agent_batch(claims))
+
+    assert first == second
+    assert len(searches) == 1
+
+
+def test_truncate_evidence_caps_content():
+    docs = [{"url": "https://example.com", "content": "x" * 5000}]
+
+    truncated = citation_agent_tool._truncate_evidence(docs)
+
+    assert len(truncated[0]["content"]) == citation_agent_tool._MAX_EVIDENCE_CHARS
+    assert len(docs[0]["content"]) == 5000
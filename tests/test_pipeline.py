@@ -0,0 +1,21 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("haystack")
+
+from src.pipeline.pipeline import PipelineStep, _run_stages
+from src.utils.models import CompanyResponse
+
+
+def test_run_stages_reports_failure_reason():
+    step = PipelineStep(
+        "CompanyResearch",
+        lambda _: {"success": False, "error": "rate limited"},
+        lambda ctx: ctx["company_name"],
+        CompanyResponse, "company_data", "Company research failed."
+    )
+
+    error = asyncio.run(_run_stages([(step,)], {"company_name": "Acme"}, lambda name: None))
+
+    assert error == "Company research failed. rate limited"
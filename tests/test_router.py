@@ -0,0 +1,25 @@
+import base64
+
+import orjson
+import pytest
+
+pytest.importorskip("fastapi")
+pytest.importorskip("haystack")
+
+from fastapi.encoders import jsonable_encoder
+
+from src.api.router import encode_pdf_content
+from src.utils.models import ReportSynthesisResponse
+
+
+def test_pipeline_response_with_pdf_serializes():
+    pdf = b"%PDF-1.4\n\xe2\xe3\xcf\xd3"
+    response = ReportSynthesisResponse(
+        success=True,
+        data={"report_title": "Acme", "pdf_content": pdf},
+    )
+
+    body = orjson.loads(orjson.dumps(jsonable_encoder(encode_pdf_content(response))))
+
+    assert base64.b64decode(body["data"]["pdf_content"]) == pdf
+    assert body["data"]["report_title"] == "Acme"
@@ -0,0 +1,101 @@
+from typing import List
+
+import pytest
+
+pytest.importorskip("pydantic")
+pytest.importorskip("orjson")
+
+from src.utils.models import Company, FrozenModel
+from src.utils.validation import (
+    BaseValidator,
+    _FAST_CHECKS,
+    _make_fast_validator,
+    COMPANY_VALIDATOR,
+    INDUSTRY_ANALYSIS_VALIDATOR,
+    REPORT_SYNTHESIS_VALIDATOR,
+)
+
+
+def test_get_schema_returns_a_copy():
+    COMPANY_VALIDATOR.get_schema()["properties"].clear()
+    INDUSTRY_ANALYSIS_VALIDATOR.get_output_schema()["items"].clear()
+
+    assert COMPANY_VALIDATOR.get_schema()["properties"]
+    assert INDUSTRY_ANALYSIS_VALIDATOR.get_output_schema()["items"]
+
+
+def test_report_output_schema_is_not_shared():
+    REPORT_SYNTHESIS_VALIDATOR.get_output_schema()["required"].append("extra")
+
+    assert "extra" not in REPORT_SYNTHESIS_VALIDATOR.get_output_schema()["required"]
+
+
+def test_validate_and_dumps_reports_invalid_data():
+    result = COMPANY_VALIDATOR.validate_and_dumps({"name": "Acme"})
+
+    assert not result.valid
+    assert result.data is None
+    assert result.error
+
+
+def test_validate_model_instance_returns_independent_lists():
+    company = Company(
+        name="Acme",
+        industry="Retail",
+        description="Sells things.",
+        products=["Widgets"],
+        headquarters="Springfield, USA",
+        sources=["https://example.com"],
+    )
+
+    data = COMPANY_VALIDATOR.validate(company).data
+    data["products"].append("Gadgets")
+
+    assert data["products"] is not company.products
+    assert company.products == ["Widgets"]
+
+
+class _FastCheckModel(FrozenModel):
+    text: str
+    number: float
+    items: List[str]
+
+
+_VALID = {"text": "a", "number": 1.5, "items": ["x", "y"]}
+
+
+@pytest.mark.parametrize("data", [
+    _VALID,
+    {**_VALID, "text": 1},
+    {**_VALID, "number": True},
+    {**_VALID, "number": 2},
+    {**_VALID, "number": "1.5"},
+    {**_VALID, "items": ("x",)},
+    {**_VALID, "items": ["x", 1]},
+    {**_VALID, "items": ["x", True]},
+    {"text": "a", "number": 1.5},
+    {**_VALID, "text": None},
+    [],
+])
+def test_fast_validator_agrees_with_pydantic(data):
+    assert {field.annotation for field in _FastCheckModel.model_fields.values()} == set(_FAST_CHECKS)
+    fast = _make_fast_validator(_FastCheckModel)
+    full = BaseValidator(_FastCheckModel).validate(data)
+
+    fast_data = fast(data)
+
+    # The fast path may defer to pydantic, but never accepts what it rejects
+    # or returns different data
+    if fast_data is not None:
+        assert full.valid
+        assert fast_data == full.data
+        assert fast_data["items"] is not data["items"]
+    elif data is _VALID:
+        pytest.fail("fast path rejected well-formed data")
+
+
+def test_fast_validator_rejects_bool_for_float():
+    fast = _make_fast_validator(_FastCheckModel)
+
+    assert fast({**_VALID, "number": True}) is None
+    assert fast({**_VALID, "number": 1.0}) == {**_VALID, "number": 1.0}